@@ -4,9 +4,12 @@ import sys
 from pathlib import Path
 
 REPOSITORY_DIR_PATH = Path(__file__).resolve().parents[2]
-sys.path.insert(0, str(REPOSITORY_DIR_PATH / "hooks" / "shared"))
+SHARED_DIR_PATH = str(REPOSITORY_DIR_PATH / "hooks" / "shared")
+if SHARED_DIR_PATH not in sys.path:
+    sys.path.insert(0, SHARED_DIR_PATH)
 
-from run_script import run_scripts_in_dir
+from gitrepository import GitRepository
+from run_script import run_hooks_in_dir
 
 GIT_HOOK_NAME = Path(__file__).stem
 SCRIPTS_DIR_PATH = REPOSITORY_DIR_PATH / "hooks" / GIT_HOOK_NAME
@@ -17,7 +20,10 @@ SCRIPTS = [
 
 
 def main():
-    success = run_scripts_in_dir(SCRIPTS_DIR_PATH, SCRIPTS)
+    repository = GitRepository(REPOSITORY_DIR_PATH)
+    with repository.cached():
+        staged_files = repository.get_staged_files()
+        success = run_hooks_in_dir(SCRIPTS_DIR_PATH, SCRIPTS, repository, staged_files)
     sys.exit(0 if success else 1)
 
 
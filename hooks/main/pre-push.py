@@ -4,7 +4,9 @@ import sys
 from pathlib import Path
 
 REPOSITORY_DIR_PATH = Path(__file__).resolve().parents[2]
-sys.path.insert(0, str(REPOSITORY_DIR_PATH / "hooks" / "shared"))
+SHARED_DIR_PATH = str(REPOSITORY_DIR_PATH / "hooks" / "shared")
+if SHARED_DIR_PATH not in sys.path:
+    sys.path.insert(0, SHARED_DIR_PATH)
 
 from run_script import run_scripts_in_dir
 
@@ -3,10 +3,18 @@ import sys
 from pathlib import Path
 
 REPOSITORY_DIR_PATH = Path(__file__).resolve().parents[2]
-sys.path.insert(0, str(REPOSITORY_DIR_PATH / "hooks" / "shared"))
+SHARED_DIR_PATH = str(REPOSITORY_DIR_PATH / "hooks" / "shared")
+if SHARED_DIR_PATH not in sys.path:
+    sys.path.insert(0, SHARED_DIR_PATH)
 
 from gitrepository import GitRepository
 
+try:
+    import pdoc  # type: ignore
+    import pdoc.render  # type: ignore
+except ImportError:
+    pdoc = None
+
 
 MODULE_PATH = REPOSITORY_DIR_PATH / "sqldatabase"
 OUTPUT_DIR_PATH = REPOSITORY_DIR_PATH / "docs"
@@ -18,6 +26,22 @@ def generate_documentation(
     output_dir_path: str | Path,
     documentation_format: str | None = None
 ) -> None:
+    if pdoc is not None:
+        # The render configuration is module state shared with the hooks run
+        # after this one in the same process, so it is restored afterwards.
+        env = pdoc.render.env
+        env_globals = dict(env.globals)
+        env_loader = env.loader
+        try:
+            if documentation_format is not None:
+                pdoc.render.configure(docformat=documentation_format)
+            pdoc.pdoc(*modules, output_directory=Path(output_dir_path))
+        finally:
+            env.globals.clear()
+            env.globals.update(env_globals)
+            env.loader = env_loader
+        return
+
     args = ["pdoc", *modules, "--output-dir", output_dir_path]
     if documentation_format is not None:
         args += ["--docformat", documentation_format]
@@ -27,16 +51,24 @@ def generate_documentation(
     )
 
 
+def update_documentation(repository: GitRepository) -> None:
+    generate_documentation(
+        MODULE_PATH,
+        output_dir_path=OUTPUT_DIR_PATH,
+        documentation_format=DOCUMENTATION_FORMAT,
+    )
+    repository.add(OUTPUT_DIR_PATH)
+
+
+def run(repository: GitRepository, staged_files: list[Path]) -> None:
+    if any(file.is_relative_to(MODULE_PATH) for file in staged_files):
+        update_documentation(repository)
+
+
 def main():
     repository = GitRepository(REPOSITORY_DIR_PATH)
-    staged_files = repository.get_staged_files(MODULE_PATH)
-    if len(staged_files):
-        generate_documentation(
-            MODULE_PATH,
-            output_dir_path=OUTPUT_DIR_PATH,
-            documentation_format=DOCUMENTATION_FORMAT,
-        )
-        repository.add(OUTPUT_DIR_PATH)
+    if repository.has_staged_changes(MODULE_PATH):
+        update_documentation(repository)
 
 
 if __name__ == "__main__":
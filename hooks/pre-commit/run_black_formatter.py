@@ -1,29 +1,48 @@
+import os
 import subprocess
 import sys
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 REPOSITORY_DIR_PATH = Path(__file__).resolve().parents[2]
-sys.path.insert(0, str(REPOSITORY_DIR_PATH / "hooks" / "shared"))
+SHARED_DIR_PATH = str(REPOSITORY_DIR_PATH / "hooks" / "shared")
+if SHARED_DIR_PATH not in sys.path:
+    sys.path.insert(0, SHARED_DIR_PATH)
 
 from gitrepository import GitRepository
 
 
 def run_black_formatter(files: Sequence[str | Path]) -> None:
-    subprocess.run(["black", *files], check=True)
-
-
-def main():
-    repository = GitRepository(REPOSITORY_DIR_PATH)
+    chunk_count = min(os.cpu_count() or 1, len(files))
+    if chunk_count <= 1:
+        subprocess.run(["black", *files], check=True)
+        return
+
+    chunks = [files[index::chunk_count] for index in range(chunk_count)]
+    with ThreadPoolExecutor(max_workers=chunk_count) as executor:
+        futures = [
+            executor.submit(subprocess.run, ["black", *chunk], check=True)
+            for chunk in chunks
+            if chunk
+        ]
+    for future in futures:
+        future.result()
+
+
+def run(repository: GitRepository, staged_files: list[Path]) -> None:
     staged_files = [
-        file
-        for file in repository.get_staged_files()
-        if file.suffix == ".py" and file.is_file()
+        file for file in staged_files if file.suffix == ".py" and file.is_file()
     ]
     if staged_files:
         run_black_formatter(staged_files)
         repository.add(*staged_files)
 
 
+def main():
+    repository = GitRepository(REPOSITORY_DIR_PATH)
+    run(repository, repository.get_staged_files())
+
+
 if __name__ == "__main__":
     main()
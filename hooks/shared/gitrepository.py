@@ -1,41 +1,166 @@
+import logging
+import os
 import subprocess
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
+STAGED = "staged"
+UNSTAGED = "unstaged"
+UNTRACKED = "untracked"
+READ_ONLY_COMMANDS = frozenset({"diff", "ls-files", "rev-parse", "status"})
+
+logger = logging.getLogger(__name__)
+
 
 class GitRepository:
     def __init__(self, path: str | Path = "."):
         self.path = Path(path).resolve()
+        self._status: dict[str, list[Path]] | None = None
+        self._cache: dict[tuple, subprocess.CompletedProcess] = {}
+        self._caching = False
 
-    def run_git_command(self, command: list[str]) -> str:
+    def clear_cache(self) -> None:
+        self._status = None
+        self._cache.clear()
+
+    @contextmanager
+    def cached(self) -> Iterator["GitRepository"]:
+        # Read-only queries depend on the index and worktree, which can change
+        # outside this object, so results are only reused within one block
+        # (e.g. one hook run) and dropped when it ends.
+        caching = self._caching
+        self._caching = True
+        try:
+            yield self
+        finally:
+            self._caching = caching
+            if not caching:
+                self.clear_cache()
+
+    def _run_git_process(
+        self, command: list[str], text: bool = True
+    ) -> subprocess.CompletedProcess:
+        read_only = self._caching and bool(command) and command[0] in READ_ONLY_COMMANDS
+        cache_key = (tuple(command), text)
+        if read_only:
+            if cache_key in self._cache:
+                return self._cache[cache_key]
+        else:
+            self.clear_cache()
+        options = command[: command.index("--")] if "--" in command else command
+        if command[:1] == ["diff"] and (
+            "--quiet" in options or "--exit-code" in options
+        ):
+            # git diff reports differences through exit code 1 in these modes.
+            success_returncodes: tuple[int, ...] = (0, 1)
+        else:
+            success_returncodes = (0,)
         command = ["git"] + command
-        print(f"Running git command: {' '.join(command)}")
-        process = subprocess.run(
-            command,
-            cwd=self.path,
-            text=True,
-            capture_output=True,
-            check=False,
-        )
-        if process.returncode != 0:
-            raise GitError(
-                f"Command '{' '.join(command)}' failed: {process.stderr.strip()}."
-            )
-        return process.stdout.strip()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running git command: %s", " ".join(command))
+        # Stderr goes to a temporary file so that it can never fill up a pipe
+        # while stdout is being read.
+        with tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(
+                command,
+                cwd=self.path,
+                text=text,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+            ) as popen:
+                stdout = popen.stdout.read()
+            if popen.returncode not in success_returncodes:
+                stderr_file.seek(0)
+                stderr = os.fsdecode(stderr_file.read())
+                raise GitError(
+                    f"Command '{' '.join(command)}' failed: {stderr.strip()}."
+                )
+        process = subprocess.CompletedProcess(command, popen.returncode, stdout)
+        if read_only:
+            self._cache[cache_key] = process
+        return process
 
-    def _get_files(
-        self, command: list[str], dir_path: str | Path | None = None
+    def run_git_command(self, command: list[str]) -> str:
+        return self._run_git_process(command).stdout.strip()
+
+    def _get_status_porcelain(self) -> dict[str, list[Path]]:
+        stdout = self._run_git_process(
+            ["status", "--porcelain=v2", "-z", "--untracked-files=all"], text=False
+        ).stdout
+        status: dict[str, list[Path]] = {STAGED: [], UNSTAGED: [], UNTRACKED: []}
+        entries = iter(stdout.split(b"\x00"))
+        for entry in entries:
+            if not entry:
+                continue
+            entry_type = entry[:1]
+            if entry_type == b"?":
+                status[UNTRACKED].append(self.path / os.fsdecode(entry[2:]))
+                continue
+            if entry_type == b"1":
+                fields = entry.split(b" ", 8)
+            elif entry_type == b"2":
+                fields = entry.split(b" ", 9)
+                # Renamed or copied entries are followed by their original path.
+                next(entries, None)
+            elif entry_type == b"u":
+                fields = entry.split(b" ", 10)
+            else:
+                continue
+            index_status, worktree_status = fields[1][:1], fields[1][1:2]
+            file = self.path / os.fsdecode(fields[-1])
+            if index_status != b"." or entry_type == b"u":
+                status[STAGED].append(file)
+            if worktree_status != b"." or entry_type == b"u":
+                status[UNSTAGED].append(file)
+        return status
+
+    def get_status(self) -> dict[str, list[Path]]:
+        if self._status is not None:
+            return self._status
+        status = self._get_status_porcelain()
+        if self._caching:
+            self._status = status
+        return status
+
+    def _filter_files(
+        self, files: list[Path], dir_path: str | Path | None = None
     ) -> list[Path]:
-        command = command.copy()
+        if not dir_path:
+            return list(files)
+        dir_path = self.path / dir_path
+        return [file for file in files if file.is_relative_to(dir_path)]
+
+    def _iter_files(
+        self, command: list[str], dir_path: str | Path | None = None
+    ) -> Iterator[Path]:
+        command = command + ["-z"]
         if dir_path:
             command.append(str(dir_path))
-        stdout = self.run_git_command(command)
-        return [self.path / file for file in stdout.splitlines()]
+        stdout = self._run_git_process(command, text=False).stdout
+        for name in stdout.split(b"\x00"):
+            if name:
+                yield self.path / os.fsdecode(name)
+
+    def _get_files(
+        self, command: list[str], dir_path: str | Path | None = None
+    ) -> list[Path]:
+        return list(self._iter_files(command, dir_path))
 
     def get_staged_files(self, dir_path: str | Path | None = None) -> list[Path]:
-        return self._get_files(["diff", "--cached", "--name-only"], dir_path)
+        return self._filter_files(self.get_status()[STAGED], dir_path)
+
+    def has_staged_changes(self, dir_path: str | Path | None = None) -> bool:
+        if self._status is not None:
+            return bool(self.get_staged_files(dir_path))
+        command = ["diff", "--cached", "--quiet"]
+        if dir_path:
+            command += ["--", str(dir_path)]
+        return self._run_git_process(command).returncode == 1
 
     def get_unstaged_files(self, dir_path: str | Path | None = None) -> list[Path]:
-        return self._get_files(["diff", "--name-only"], dir_path)
+        return self._filter_files(self.get_status()[UNSTAGED], dir_path)
 
     def get_changed_files(self, dir_path: str | Path | None = None) -> list[Path]:
         return self._get_files(["diff", "HEAD", "--name-only"], dir_path)
@@ -43,8 +168,11 @@ class GitRepository:
     def get_tracked_files(self, dir_path: str | Path | None = None) -> list[Path]:
         return self._get_files(["ls-files"], dir_path)
 
+    def iter_tracked_files(self, dir_path: str | Path | None = None) -> Iterator[Path]:
+        return self._iter_files(["ls-files"], dir_path)
+
     def get_untracked_files(self, dir_path: str | Path | None = None) -> list[Path]:
-        return self._get_files(["ls-files", "--others", "--exclude-standard"], dir_path)
+        return self._filter_files(self.get_status()[UNTRACKED], dir_path)
 
     def add(self, *files: str | Path) -> str:
         return self.run_git_command(["add"] + list(map(str, files)))
@@ -1,6 +1,10 @@
+import importlib.util
 import subprocess
 import sys
+import traceback
 from pathlib import Path
+from types import ModuleType
+from typing import Any
 
 
 def run_script(path: str | Path) -> bool:
@@ -12,6 +16,36 @@ def run_script(path: str | Path) -> bool:
     return process.returncode == 0
 
 
+def import_script(path: str | Path) -> ModuleType:
+    path = Path(path)
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None and spec.loader is not None, f"Cannot import {path}."
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_hook(path: str | Path, *args: Any) -> bool:
+    path = Path(path)
+    print(f"Running script: {path.name}")
+    try:
+        import_script(path).run(*args)
+    except Exception:
+        traceback.print_exc()
+        print(f"Script failed: {path.name}")
+        return False
+    return True
+
+
+def run_hooks_in_dir(dir_path: str | Path, scripts: list[str], *args: Any) -> bool:
+    success = True
+    for script in scripts:
+        script_success = run_hook(Path(dir_path) / script, *args)
+        if script_success is False:
+            success = False
+    return success
+
+
 def run_scripts_in_dir(dir_path: str | Path, scripts: list[str]) -> bool:
     success = True
     for script in scripts:
@@ -8,15 +8,29 @@ T = TypeVar("T")
 
 class EnumLikeContainer(Generic[T]):
     item_type: Type[T]
+    _template_items: tuple[tuple[str, Any, bool], ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if not hasattr(cls, "item_type"):
+            return
+        template_items: dict[str, Any] = {}
+        for base in reversed(cls.__mro__):
+            for name, value in base.__dict__.items():
+                if cls._condition(value, cls.item_type):
+                    template_items[name] = value
+        cls._template_items = tuple(
+            (name, value, not isinstance(value, type))
+            for name, value in template_items.items()
+        )
 
     def __init__(self) -> None:
         self._items: dict[str, T] = {}
-        for base in reversed(self.__class__.__mro__):
-            for name, value in base.__dict__.items():
-                if self._condition(value, self.item_type):
-                    item = copy.deepcopy(value, memo={})
-                    self._items[name] = item
-                    setattr(self, name, item)
+        self._items_by_name: dict[str, T] | None = None
+        for name, value, clone in self._template_items:
+            item = self._clone_item(value) if clone else value
+            self._items[name] = item
+            setattr(self, name, item)
 
     def __getitem__(self, key: str) -> T:
         return self._items[key]
@@ -31,8 +45,17 @@ class EnumLikeContainer(Generic[T]):
         return key in self._items.values()
 
     def __call__(self, name: str) -> T:
+        if self._items_by_name is None:
+            self._items_by_name = {}
+            for item in self:
+                self._items_by_name.setdefault(getattr(item, "name", None), item)
+        item = self._items_by_name.get(name)
+        if item is not None and getattr(item, "name", None) == name:
+            return item
+        # Item names can change after the index is built, so fall back to a scan.
         for item in self:
             if getattr(item, "name", None) == name:
+                self._items_by_name = None
                 return item
         raise ValueError(f"{self.__class__.__name__} has no item with name '{name}'.")
 
@@ -49,6 +72,13 @@ class EnumLikeContainer(Generic[T]):
     def _condition(value: Any, item_type: type) -> bool:
         return isinstance(value, item_type)
 
+    @staticmethod
+    def _clone_item(value: Any) -> Any:
+        deepcopy = getattr(type(value), "__deepcopy__", None)
+        if deepcopy is not None:
+            return deepcopy(value, {})
+        return copy.deepcopy(value, memo={})
+
 
 class EnumLikeClassContainer(EnumLikeContainer, Generic[T]):
     def __iter__(self) -> Iterator[Type[T]]:
@@ -11,6 +11,8 @@ class SqlBase(ABC):
         to_sql: Abstract method to convert the object to its SQL representation.
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return self.to_sql()
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 import copy
-import uuid
+import itertools
+import sys
+import types
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -13,6 +15,47 @@ from .sqldatatype import SqlDataType, SqlDataTypes
 if TYPE_CHECKING:
     from .sqltable import SqlTable
 
+IMMUTABLE_TYPES = frozenset(
+    {type(None), bool, int, float, str, bytes, type, types.FunctionType}
+)
+# Attributes that always hold immutable values (names, flags, enum classes,
+# converters and cached names) and can be shared between column copies.
+SHARED_ATTRIBUTES = frozenset(
+    {
+        "name",
+        "primary_key",
+        "autoincrement",
+        "not_null",
+        "unique",
+        "values",
+        "to_database_converter",
+        "from_database_converter",
+        "_table_fully_qualified_name",
+        "_fully_qualified_name",
+        "_alias",
+        "_parameter_name_prefix",
+    }
+)
+
+# Slot names of column classes, including those declared by base classes and
+# subclasses, resolved on first copy.
+SLOT_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _get_slot_names(cls: type) -> tuple[str, ...]:
+    slot_names = SLOT_NAMES.get(cls)
+    if slot_names is None:
+        names: list[str] = []
+        for base in cls.__mro__:
+            slots = base.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                if name not in ("__dict__", "__weakref__") and name not in names:
+                    names.append(name)
+        slot_names = SLOT_NAMES[cls] = tuple(names)
+    return slot_names
+
 
 class SqlColumn(SqlBase):
     """
@@ -32,6 +75,29 @@ class SqlColumn(SqlBase):
         values (type[Enum] | None): Enum values for the column.
     """
 
+    __slots__ = (
+        "name",
+        "data_type",
+        "primary_key",
+        "autoincrement",
+        "not_null",
+        "unique",
+        "default_value",
+        "reference",
+        "values",
+        "to_database_converter",
+        "from_database_converter",
+        "table",
+        "_filters",
+        "_foreign_keys",
+        "_table_fully_qualified_name",
+        "_fully_qualified_name",
+        "_alias",
+        "_parameter_name_prefix",
+    )
+
+    _parameter_counter = itertools.count()
+
     def __init__(
         self,
         name: str,
@@ -80,11 +146,15 @@ class SqlColumn(SqlBase):
             ), "Converters cannot be specified together with values."
             self.to_database_converter = lambda value: value.value
             self.from_database_converter = self.values
-        self.filters = SqlColumnFilters(self)
+        self._filters: SqlColumnFilters | None = None
         self._foreign_keys: list[SqlColumn] = []
         if self.reference is not None:
             self.reference._foreign_keys.append(self)
         self.table: SqlTable | None = None
+        self._table_fully_qualified_name: str | None = None
+        self._fully_qualified_name = ""
+        self._alias = ""
+        self._parameter_name_prefix = ""
 
     def __deepcopy__(self, memo) -> SqlColumn:
         """Create a deep copy of the SqlColumn instance.
@@ -101,11 +171,21 @@ class SqlColumn(SqlBase):
         cls = self.__class__
         column = cls.__new__(cls)
         memo[id(self)] = column
-        for name, value in self.__dict__.items():
-            if name not in ("_foreign_keys", "filters", "reference", "table"):
-                setattr(column, name, copy.deepcopy(value, memo))
+        for name in _get_slot_names(cls):
+            if name in ("_foreign_keys", "_filters", "reference", "table"):
+                continue
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+            if name not in SHARED_ATTRIBUTES and type(value) not in IMMUTABLE_TYPES:
+                value = copy.deepcopy(value, memo)
+            setattr(column, name, value)
+        if hasattr(self, "__dict__"):
+            column.__dict__.update(copy.deepcopy(self.__dict__, memo))
 
-        column.filters = SqlColumnFilters(column)
+        column._filters = None
+        column.table = None
         column.reference = self.reference
         if column.reference is not None:
             column.reference._foreign_keys.remove(self)
@@ -115,23 +195,59 @@ class SqlColumn(SqlBase):
             foreign_key.reference = column
         return column
 
+    @property
+    def filters(self) -> SqlColumnFilters:
+        """Get the filters that can be applied to the column.
+
+        The filters are created on first access, as most columns are never filtered on.
+
+        Returns:
+            SqlColumnFilters: The filters for the column.
+        """
+        if self._filters is None:
+            self._filters = SqlColumnFilters(self)
+        return self._filters
+
+    def _update_names(self) -> None:
+        """Recompute the cached names if the table's fully qualified name changed.
+
+        The table's fully qualified name depends on the database it is bound to,
+        so the cache is keyed on it rather than computed once. The names are
+        interned, so copies of the same column share one string per name and
+        compare by identity.
+        """
+        if self.table is None:
+            raise AttributeError("The 'table' attribute is not set for this column.")
+        table_fully_qualified_name = self.table.fully_qualified_name
+        if table_fully_qualified_name != self._table_fully_qualified_name:
+            fully_qualified_name = sys.intern(
+                f"{table_fully_qualified_name}.{self.name}"
+            )
+            self._table_fully_qualified_name = table_fully_qualified_name
+            self._fully_qualified_name = fully_qualified_name
+            self._alias = sys.intern(f"COLUMN.{fully_qualified_name}")
+            self._parameter_name_prefix = sys.intern(
+                fully_qualified_name.replace(".", "_")
+            )
+
     @property
     def alias(self) -> str:
-        return f"COLUMN.{self.fully_qualified_name}"
+        self._update_names()
+        return self._alias
 
     @property
     def fully_qualified_name(self) -> str:
-        if self.table is None:
-            raise AttributeError("The 'table' attribute is not set for this column.")
-        return f"{self.table.fully_qualified_name}.{self.name}"
+        self._update_names()
+        return self._fully_qualified_name
 
     def generate_parameter_name(self) -> str:
         """Generate a unique parameter name for the column.
 
         Returns:
-            str: A unique parameter name in the format '<fully_qualified_name>_<uuid>'.
+            str: A unique parameter name in the format '<fully_qualified_name>_<counter>'.
         """
-        return f"{self.fully_qualified_name.replace('.', '_')}_{uuid.uuid4().hex[:8]}"
+        self._update_names()
+        return f"{self._parameter_name_prefix}_{next(SqlColumn._parameter_counter):x}"
 
     def to_sql(self) -> str:
         """Convert the column to its SQL representation.
@@ -16,16 +16,21 @@ class SqlColumnFilter(SqlCondition):
         column (SqlColumn): The column to which the filter is applied.
     """
 
+    __slots__ = ("column",)
+
     operator: ESqlComparisonOperator
 
     def __init__(self, column: SqlColumn, *values) -> None:
         """Initialize a SqlColumnFilter instance.
 
+        The operator is a class attribute of each filter type, so it is not
+        stored on the instance.
+
         Args:
             column (SqlColumn): The column to which the filter is applied.
             *values: The values used in the filter.
         """
-        SqlCondition.__init__(self, column, self.operator, *values)
+        self._initialize(column, values)
         self.column = column
 
 
@@ -36,6 +41,8 @@ class ValueColumnFilter(SqlColumnFilter):
         value (Any): The value used in the filter.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, column: SqlColumn, value: Any) -> None:
         """Initialize a ValueColumnFilter instance.
 
@@ -50,48 +57,64 @@ class ValueColumnFilter(SqlColumnFilter):
 class IsEqualColumnFilter(ValueColumnFilter):
     """Represents a filter that checks for equality."""
 
+    __slots__ = ()
+
     operator = ESqlComparisonOperator.IS_EQUAL
 
 
 class IsNotEqualColumnFilter(ValueColumnFilter):
     """Represents a filter that checks for inequality."""
 
+    __slots__ = ()
+
     operator = ESqlComparisonOperator.IS_NOT_EQUAL
 
 
 class IsLessThanColumnFilter(ValueColumnFilter):
     """Represents a filter that checks if a value is less than another."""
 
+    __slots__ = ()
+
     operator = ESqlComparisonOperator.IS_LESS_THAN
 
 
 class IsLessThanOrEqualColumnFilter(ValueColumnFilter):
     """Represents a filter that checks if a value is less than or equal to another."""
 
+    __slots__ = ()
+
     operator = ESqlComparisonOperator.IS_LESS_THAN_OR_EQUAL
 
 
 class IsGreaterThanColumnFilter(ValueColumnFilter):
     """Represents a filter that checks if a value is greater than another."""
 
+    __slots__ = ()
+
     operator = ESqlComparisonOperator.IS_GREATER_THAN
 
 
 class IsGreaterThanOrEqualColumnFilter(ValueColumnFilter):
     """Represents a filter that checks if a value is greater than or equal to another."""
 
+    __slots__ = ()
+
     operator = ESqlComparisonOperator.IS_GREATER_THAN_OR_EQUAL
 
 
 class IsLikeColumnFilter(ValueColumnFilter):
     """Represents a filter that checks if a value matches a pattern."""
 
+    __slots__ = ()
+
     operator = ESqlComparisonOperator.IS_LIKE
 
 
 class IsNotLikeColumnFilter(ValueColumnFilter):
     """Represents a filter that checks if a value does not match a pattern."""
 
+    __slots__ = ()
+
     operator = ESqlComparisonOperator.IS_NOT_LIKE
 
 
@@ -102,6 +125,8 @@ class ValuesColumnFilter(SqlColumnFilter):
         values (Iterable): The values used in the filter.
     """
 
+    __slots__ = ("values",)
+
     def __init__(self, column: SqlColumn, values: Iterable) -> None:
         """Initialize a ValuesColumnFilter instance.
 
@@ -109,18 +134,25 @@ class ValuesColumnFilter(SqlColumnFilter):
             column (SqlColumn): The column to which the filter is applied.
             values (Iterable): The values used in the filter.
         """
-        SqlColumnFilter.__init__(self, column, *values)
+        values = values if isinstance(values, tuple) else tuple(values)
+        self._initialize(column, values)
+        self.column = column
+        self.values = values
 
 
 class IsInColumnFilter(ValuesColumnFilter):
     """Represents a filter that checks if a value is in a set of values."""
 
+    __slots__ = ()
+
     operator = ESqlComparisonOperator.IS_IN
 
 
 class IsNotInColumnFilter(ValuesColumnFilter):
     """Represents a filter that checks if a value is not in a set of values."""
 
+    __slots__ = ()
+
     operator = ESqlComparisonOperator.IS_NOT_IN
 
 
@@ -132,6 +164,8 @@ class BetweenColumnFilter(SqlColumnFilter):
         upper_value (Any): The upper bound value.
     """
 
+    __slots__ = ("lower_value", "upper_value")
+
     def __init__(self, column: SqlColumn, lower_value: Any, upper_value: Any):
         """Initialize a BetweenColumnFilter instance.
 
@@ -148,18 +182,24 @@ class BetweenColumnFilter(SqlColumnFilter):
 class IsBetweenColumnFilter(BetweenColumnFilter):
     """Represents a filter that checks if a value is between two bounds."""
 
+    __slots__ = ()
+
     operator = ESqlComparisonOperator.IS_BETWEEN
 
 
 class IsNotBetweenColumnFilter(BetweenColumnFilter):
     """Represents a filter that checks if a value is not between two bounds."""
 
+    __slots__ = ()
+
     operator = ESqlComparisonOperator.IS_NOT_BETWEEN
 
 
 class NullColumnFilter(SqlColumnFilter):
     """Represents a filter that checks for null values."""
 
+    __slots__ = ()
+
     def __init__(self, column: SqlColumn):
         SqlColumnFilter.__init__(self, column)
 
@@ -167,12 +207,16 @@ class NullColumnFilter(SqlColumnFilter):
 class IsNullColumnFilter(SqlColumnFilter):
     """Represents a filter that checks if a value is null."""
 
+    __slots__ = ()
+
     operator = ESqlComparisonOperator.IS_NULL
 
 
 class IsNotNullColumnFilter(SqlColumnFilter):
     """Represents a filter that checks if a value is not null."""
 
+    __slots__ = ()
+
     operator = ESqlComparisonOperator.IS_NOT_NULL
 
 
@@ -183,6 +227,8 @@ class SqlColumnFilters:
         column (SqlColumn): The column to which the filters are applied.
     """
 
+    __slots__ = ("column",)
+
     def __init__(self, column: SqlColumn):
         """Initialize a SqlColumnFilters instance.
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any
+from collections import ChainMap
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any, Callable
 
 from .sqlbase import SqlBase
 from .sqlfunction import SqlAggregateFunction
@@ -8,8 +10,152 @@ from .sqloperator import ESqlComparisonOperator, ESqlLogicalOperator
 
 if TYPE_CHECKING:
     from .sqlcolumn import SqlColumn
+    from .sqlrecord import SqlRecord
     from .sqlstatement import SqlSelectStatement
 
+# These modules import this one, so the classes are resolved on first use.
+_SqlColumn: type[SqlColumn] | None = None
+_SqlRecord: type[SqlRecord] | None = None
+_SqlSelectStatement: type[SqlSelectStatement] | None = None
+
+
+def _late_bind() -> None:
+    global _SqlColumn, _SqlRecord, _SqlSelectStatement
+    from .sqlcolumn import SqlColumn
+    from .sqlrecord import SqlRecord
+    from .sqlstatement import SqlSelectStatement
+
+    _SqlColumn = SqlColumn
+    _SqlRecord = SqlRecord
+    _SqlSelectStatement = SqlSelectStatement
+    VALUE_PARSERS[SqlColumn] = _parse_column_value
+    VALUE_PARSERS[SqlSelectStatement] = _parse_select_value
+    ITEMS_TO_SQL[SqlColumn] = _column_to_sql
+    ITEMS_TO_SQL[SqlSelectStatement] = _select_to_sql
+
+
+def _parse_literal_value(condition: SqlCondition, value: Any, item: Any) -> None:
+    parameter = condition.left.generate_parameter_name()
+    condition._values_to_sql.append(f":{parameter}")
+    condition._parameters[parameter] = _SqlRecord.to_database_value(item, value)
+
+
+def _parse_column_value(condition: SqlCondition, value: SqlColumn, item: Any) -> None:
+    condition._values_to_sql.append(value.fully_qualified_name)
+
+
+def _parse_function_value(
+    condition: SqlCondition, value: SqlAggregateFunction, item: Any
+) -> None:
+    condition._values_to_sql.append(value.to_sql())
+
+
+def _parse_select_value(
+    condition: SqlCondition, value: SqlSelectStatement, item: Any
+) -> None:
+    condition._values_to_sql.append(f"({value.template_sql.rstrip(";")})")
+    condition._chain_parameters(value.template_parameters)
+
+
+# Parsers of condition values by exact type. Columns and select statements are
+# registered on late binding, other types (including subclasses of those) are
+# resolved on first use.
+VALUE_PARSERS: dict[type, Callable[[SqlCondition, Any, Any], None]] = {}
+
+
+def _get_value_parser(value_type: type) -> Callable[[SqlCondition, Any, Any], None]:
+    parser = VALUE_PARSERS.get(value_type)
+    if parser is None:
+        if issubclass(value_type, _SqlColumn):
+            parser = _parse_column_value
+        elif issubclass(value_type, _SqlSelectStatement):
+            parser = _parse_select_value
+        elif issubclass(value_type, SqlAggregateFunction):
+            parser = _parse_function_value
+        else:
+            parser = _parse_literal_value
+        VALUE_PARSERS[value_type] = parser
+    return parser
+
+
+def _column_to_sql(item: SqlColumn) -> str:
+    return item.fully_qualified_name
+
+
+def _function_to_sql(item: SqlAggregateFunction) -> str:
+    return item.to_sql()
+
+
+def _select_to_sql(item: SqlSelectStatement) -> str:
+    return f"({item.to_sql()})"
+
+
+# Converters of the left-hand side of conditions by exact type. Columns and
+# select statements are registered on late binding, other types (including
+# subclasses of those) are resolved on first use.
+ITEMS_TO_SQL: dict[type, Callable[[Any], str]] = {}
+
+
+def _get_item_to_sql(item_type: type) -> Callable[[Any], str] | None:
+    item_to_sql = ITEMS_TO_SQL.get(item_type)
+    if item_to_sql is None:
+        if issubclass(item_type, _SqlColumn):
+            item_to_sql = _column_to_sql
+        elif issubclass(item_type, _SqlSelectStatement):
+            item_to_sql = _select_to_sql
+        elif issubclass(item_type, SqlAggregateFunction):
+            item_to_sql = _function_to_sql
+        else:
+            return None
+        ITEMS_TO_SQL[item_type] = item_to_sql
+    return item_to_sql
+
+
+def _no_values_to_sql(values_to_sql: list[str]) -> str:
+    return ""
+
+
+def _range_values_to_sql(values_to_sql: list[str]) -> str:
+    lower_value, upper_value = values_to_sql
+    return f" {lower_value} AND {upper_value}"
+
+
+def _list_values_to_sql(values_to_sql: list[str]) -> str:
+    return f" ({', '.join(values_to_sql)})"
+
+
+def _single_value_to_sql(values_to_sql: list[str]) -> str:
+    return f" {values_to_sql[0]}"
+
+
+VALUES_TO_SQL: dict[ESqlComparisonOperator, Callable[[list[str]], str]] = {
+    ESqlComparisonOperator.IS_NULL: _no_values_to_sql,
+    ESqlComparisonOperator.IS_NOT_NULL: _no_values_to_sql,
+    ESqlComparisonOperator.IS_BETWEEN: _range_values_to_sql,
+    ESqlComparisonOperator.IS_NOT_BETWEEN: _range_values_to_sql,
+    ESqlComparisonOperator.IS_IN: _list_values_to_sql,
+    ESqlComparisonOperator.IS_NOT_IN: _list_values_to_sql,
+}
+
+# Number of values each operator requires, None for any number. Operators not
+# listed take a single value.
+REQUIRED_VALUE_COUNTS: dict[ESqlComparisonOperator, int | None] = {
+    ESqlComparisonOperator.IS_NULL: 0,
+    ESqlComparisonOperator.IS_NOT_NULL: 0,
+    ESqlComparisonOperator.IS_BETWEEN: 2,
+    ESqlComparisonOperator.IS_NOT_BETWEEN: 2,
+    ESqlComparisonOperator.IS_IN: None,
+    ESqlComparisonOperator.IS_NOT_IN: None,
+}
+
+# SQL keywords of the operators, padded the way they are rendered in conditions.
+COMPARISON_OPERATORS_TO_SQL: dict[ESqlComparisonOperator, str] = {
+    operator: f" {operator.to_sql()}" for operator in ESqlComparisonOperator
+}
+LOGICAL_OPERATORS_TO_SQL: dict[ESqlLogicalOperator, str] = {
+    operator: f" {operator.to_sql()} " for operator in ESqlLogicalOperator
+}
+
 
 class SqlCondition(SqlBase):
     """
@@ -19,10 +165,16 @@ class SqlCondition(SqlBase):
         left (SqlColumn | SqlAggregateFunction | SqlSelectStatement): The left-hand side of the condition.
         operator (ESqlComparisonOperator): The comparison operator.
         right (Any): The right-hand side of the condition.
-        parameters (dict[str, Any]): Parameters for the condition.
+        parameters (dict[str, Any] | ChainMap[str, Any]): Parameters for the condition.
+            Parameters of subqueries are chained rather than copied.
+        _parameters (dict[str, Any] | ChainMap[str, Any] | None): The parameters,
+            None until the values are parsed.
         _values_to_sql (list[str]): SQL representations of the values.
+        _sql (str | None): The SQL representation of the condition, built on first use.
     """
 
+    __slots__ = ("left", "operator", "right", "_parameters", "_values_to_sql", "_sql")
+
     def __init__(
         self,
         left: SqlColumn | SqlAggregateFunction | SqlSelectStatement,
@@ -37,17 +189,22 @@ class SqlCondition(SqlBase):
             operator (ESqlComparisonOperator): The comparison operator.
             right (Any): The right-hand side of the condition.
         """
-        from .sqlstatement import SqlSelectStatement
+        self.operator = operator
+        self._initialize(left, right)
 
+    def _initialize(
+        self,
+        left: SqlColumn | SqlAggregateFunction | SqlSelectStatement,
+        right: tuple[Any, ...],
+    ) -> None:
+        if _SqlSelectStatement is None:
+            _late_bind()
         self.left = left
-        self.operator = operator
         self.right = right
-        self.parameters: dict[str, Any] = {}
+        self._parameters: dict[str, Any] | ChainMap[str, Any] | None = None
         self._values_to_sql: list[str] = []
+        self._sql: str | None = None
         self._validate_value_count()
-        self._parse_values()
-        if isinstance(self.left, SqlSelectStatement):
-            self.parameters.update(self.left.parameters)
 
     def __and__(self, other: SqlCondition):
         """
@@ -73,24 +230,61 @@ class SqlCondition(SqlBase):
         """
         return SqlCompoundCondition(self, ESqlLogicalOperator.OR, other)
 
-    def _validate_value_count(self) -> None:
-        if self.operator in (
-            ESqlComparisonOperator.IS_NULL,
-            ESqlComparisonOperator.IS_NOT_NULL,
-        ):
-            required_value_count = 0
-        elif self.operator in (
-            ESqlComparisonOperator.IS_BETWEEN,
-            ESqlComparisonOperator.IS_NOT_BETWEEN,
-        ):
-            required_value_count = 2
-        elif self.operator in (
-            ESqlComparisonOperator.IS_IN,
-            ESqlComparisonOperator.IS_NOT_IN,
-        ):
-            required_value_count = None
+    def parameter_items(self) -> Iterator[tuple[str, Any]]:
+        """
+        Iterate over the parameters of the condition as (name, value) pairs.
+
+        Chained parameter mappings are walked directly, one after another,
+        which avoids the per-key lookups through the whole chain that iterating
+        the chain map itself would cost.
+
+        Returns:
+            Iterator[tuple[str, Any]]: The parameter names and values.
+        """
+        parameters = self.parameters
+        if isinstance(parameters, ChainMap):
+            for mapping in parameters.maps:
+                yield from mapping.items()
         else:
-            required_value_count = 1
+            yield from parameters.items()
+
+    @property
+    def parameters(self) -> dict[str, Any] | ChainMap[str, Any]:
+        """
+        Get the parameters of the condition.
+
+        The values are parsed into parameters on first use, so conditions that
+        are never rendered or executed do not pay for it.
+
+        Returns:
+            dict[str, Any] | ChainMap[str, Any]: The parameters of the condition.
+        """
+        if self._parameters is None:
+            self._parse()
+        return self._parameters  # type: ignore
+
+    def _parse(self) -> None:
+        self._parameters = {}
+        self._values_to_sql = []
+        self._parse_values()
+        if isinstance(self.left, _SqlSelectStatement):
+            self._chain_parameters(self.left.parameters)
+
+    def _chain_parameters(self, parameters: Mapping[str, Any]) -> None:
+        """Chain the parameters of a subquery to the parameters of the condition.
+
+        Args:
+            parameters (Mapping[str, Any]): The parameters to chain.
+        """
+        if not parameters:
+            return
+        if isinstance(self._parameters, ChainMap):
+            self._parameters.maps.append(parameters)
+        else:
+            self._parameters = ChainMap(self._parameters, parameters)  # type: ignore
+
+    def _validate_value_count(self) -> None:
+        required_value_count = REQUIRED_VALUE_COUNTS.get(self.operator, 1)
         assert (
             required_value_count is None or len(self.right) == required_value_count
         ), (
@@ -99,72 +293,83 @@ class SqlCondition(SqlBase):
         )
 
     def _parse_values(self) -> None:
-        from .sqlcolumn import SqlColumn
-        from .sqlrecord import SqlRecord
-        from .sqlstatement import SqlSelectStatement
-
         item = (
             self.left.context["items"][0]
-            if isinstance(self.left, SqlSelectStatement)
+            if isinstance(self.left, _SqlSelectStatement)
             else self.left
         )
+        value_parsers = {
+            value_type: _get_value_parser(value_type)
+            for value_type in set(map(type, self.right))
+        }
+        if all(parser is _parse_literal_value for parser in value_parsers.values()):
+            # Only literal values, e.g. a long IN list: build everything in bulk.
+            generate_parameter_name = self.left.generate_parameter_name
+            to_database_value = _SqlRecord.to_database_value
+            parameter_names = [generate_parameter_name() for _ in self.right]
+            self._values_to_sql = [f":{parameter}" for parameter in parameter_names]
+            self._parameters.update(  # type: ignore
+                zip(
+                    parameter_names,
+                    [to_database_value(item, value) for value in self.right],
+                )
+            )
+            return
+
         for value in self.right:
-            if isinstance(value, SqlColumn):
-                self._values_to_sql.append(value.fully_qualified_name)
-            elif isinstance(value, SqlAggregateFunction):
-                self._values_to_sql.append(value.to_sql())
-            elif isinstance(value, SqlSelectStatement):
-                self._values_to_sql.append(f"({value.template_sql.rstrip(";")})")
-                self.parameters.update(value.template_parameters)
-            else:
-                parameter = self.left.generate_parameter_name()
-                self._values_to_sql.append(f":{parameter}")
-                self.parameters[parameter] = SqlRecord.to_database_value(item, value)
+            value_parsers[type(value)](self, value, item)
 
     def to_sql(self) -> str:
-        from .sqlcolumn import SqlColumn
-        from .sqlstatement import SqlSelectStatement
-
-        if isinstance(self.left, SqlColumn):
-            sql = self.left.fully_qualified_name
-        elif isinstance(self.left, SqlAggregateFunction):
-            sql = self.left.to_sql()
-        elif isinstance(self.left, SqlSelectStatement):
-            sql = f"({self.left.to_sql()})"
-        else:
-            assert False, f"Invalid item: {self.left}."
+        """
+        Convert the condition to its SQL representation.
 
-        sql += f" {self.operator}"
-        if self.operator in (
-            ESqlComparisonOperator.IS_NULL,
-            ESqlComparisonOperator.IS_NOT_NULL,
-        ):
-            return sql
-        elif self.operator in (
-            ESqlComparisonOperator.IS_BETWEEN,
-            ESqlComparisonOperator.IS_NOT_BETWEEN,
-        ):
-            lower_value, upper_value = self._values_to_sql
-            return sql + f" {lower_value} AND {upper_value}"
-        elif self.operator in (
-            ESqlComparisonOperator.IS_IN,
-            ESqlComparisonOperator.IS_NOT_IN,
-        ):
-            return sql + f" ({', '.join(self._values_to_sql)})"
-        else:
-            return sql + f" {self._values_to_sql[0]}"
+        The condition does not change after it is created, so the SQL is built
+        on first use and reused afterwards.
+
+        Returns:
+            str: The SQL representation of the condition.
+        """
+        if self._sql is None:
+            self._sql = self._build_sql()
+        return self._sql
+
+    def _build_sql(self) -> str:
+        if _SqlSelectStatement is None:
+            _late_bind()
+        if self._parameters is None:
+            self._parse()
+        item_to_sql = _get_item_to_sql(type(self.left))
+        assert item_to_sql is not None, f"Invalid item: {self.left}."
+        sql = item_to_sql(self.left)
+
+        values_to_sql = VALUES_TO_SQL.get(self.operator, _single_value_to_sql)
+        operator = COMPARISON_OPERATORS_TO_SQL[self.operator]
+        return f"{sql}{operator}{values_to_sql(self._values_to_sql)}"
 
 
 class SqlCompoundCondition(SqlCondition):
     """Represents a compound SQL condition combining two conditions with a logical operator.
 
+    AND and OR are associative, so operands that are compound conditions with the
+    same operator are flattened into a single list of conditions. A chain like
+    ``a | b | c`` renders as ``(a OR b OR c)`` and is built in linear time, as
+    each link appends to the list of the previous one while nothing else has.
+
     Attributes:
         left (SqlCondition): The left-hand side condition.
         operator (ESqlLogicalOperator): The logical operator (e.g., AND, OR).
         right (SqlCondition): The right-hand side condition.
-        parameters (dict[str, Any]): Combined parameters from both conditions.
+        conditions (list[SqlCondition]): The flattened conditions.
+        parameters (ChainMap[str, Any]): Combined parameters from both conditions.
+        _conditions (list[SqlCondition]): The flattened conditions, possibly shared
+            with later links of a chain.
+        _condition_count (int): The number of conditions in the shared list that
+            belong to this condition.
+        _parameters (ChainMap[str, Any] | None): The combined parameters, built on first use.
     """
 
+    __slots__ = ("_conditions", "_condition_count")
+
     def __init__(
         self,
         left: SqlCondition,
@@ -181,12 +386,129 @@ class SqlCompoundCondition(SqlCondition):
         self.left = left  # type: ignore
         self.operator: ESqlLogicalOperator = operator  # type: ignore
         self.right = right  # type: ignore
-        self.parameters = left.parameters | right.parameters
+        self._sql = None
+        self._parameters: ChainMap[str, Any] | None = None
+        right_conditions = self._operand_conditions(right)
+        if (
+            self._is_flattened(left)
+            and len(left._conditions) == left._condition_count  # type: ignore
+        ):
+            conditions = left._conditions  # type: ignore
+        else:
+            conditions = self._operand_conditions(left)
+        conditions.extend(right_conditions)
+        self._conditions: list[SqlCondition] = conditions
+        self._condition_count = len(conditions)
 
-    def to_sql(self) -> str:
+    @property
+    def conditions(self) -> list[SqlCondition]:
+        """Get the flattened conditions combined by the compound condition.
+
+        Returns:
+            list[SqlCondition]: The conditions.
+        """
+        return self._conditions[: self._condition_count]
+
+    @property  # type: ignore
+    def parameters(self) -> ChainMap[str, Any]:  # type: ignore
+        """Get the combined parameters of the conditions.
+
+        Intermediate links of a long chain are usually never asked for their
+        parameters, so the chain map is built on first use. Nested compound
+        conditions are walked iteratively, without building chain maps of their
+        own, so every parameter mapping is collected once however deep the
+        condition tree is.
+
+        Returns:
+            ChainMap[str, Any]: The combined parameters.
+        """
+        if self._parameters is None:
+            maps: list[Mapping[str, Any]] = []
+            stack: list[SqlCondition] = self.conditions[::-1]
+            while stack:
+                condition = stack.pop()
+                if (
+                    isinstance(condition, SqlCompoundCondition)
+                    and condition._parameters is None
+                ):
+                    stack.extend(reversed(condition.conditions))
+                else:
+                    maps.extend(self._parameter_maps(condition))
+            self._parameters = ChainMap(*maps)
+        return self._parameters
+
+    def _is_flattened(self, condition: SqlCondition) -> bool:
+        """Check whether an operand is flattened into the compound condition.
+
+        Args:
+            condition (SqlCondition): The operand.
+
+        Returns:
+            bool: True if the operand is a compound condition with the same operator.
+        """
+        return (
+            isinstance(condition, SqlCompoundCondition)
+            and condition.operator is self.operator
+        )
+
+    def _operand_conditions(self, condition: SqlCondition) -> list[SqlCondition]:
+        """Get the conditions an operand contributes to the compound condition.
+
+        Args:
+            condition (SqlCondition): The operand.
+
+        Returns:
+            list[SqlCondition]: A new list with the conditions of the operand.
+        """
+        if self._is_flattened(condition):
+            return condition.conditions  # type: ignore
+        return [condition]
+
+    @staticmethod
+    def _parameter_maps(condition: SqlCondition) -> list[Mapping[str, Any]]:
+        """Get the non-empty parameter mappings of a condition.
+
+        Nested compound conditions contribute their underlying mappings so the
+        resulting chain stays flat regardless of how deep the condition tree is.
+        Empty mappings, such as the own parameters of a condition on a subquery,
+        are left out so that lookups never walk through them.
+
+        Args:
+            condition (SqlCondition): The condition to get the parameter mappings of.
+
+        Returns:
+            list[Mapping[str, Any]]: The parameter mappings of the condition.
+        """
+        parameters = condition.parameters
+        if isinstance(parameters, ChainMap):
+            return [mapping for mapping in parameters.maps if mapping]
+        return [parameters] if parameters else []
+
+    def _build_sql(self) -> str:
         """Convert the compound condition to its SQL representation.
 
+        The condition tree is walked iteratively and its fragments are joined
+        once, so nested compound conditions neither recurse nor build
+        intermediate strings. Conditions already converted reuse their SQL.
+
         Returns:
             str: The SQL representation of the compound condition.
         """
-        return f"({self.left} {self.operator} {self.right})"
+        parts: list[str] = []
+        stack: list[SqlCondition | str] = [self]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                parts.append(item)
+            elif isinstance(item, SqlCompoundCondition) and item._sql is None:
+                operator = LOGICAL_OPERATORS_TO_SQL[item.operator]
+                items: list[SqlCondition | str] = ["("]
+                for index, condition in enumerate(item.conditions):
+                    if index:
+                        items.append(operator)
+                    items.append(condition)
+                items.append(")")
+                stack.extend(reversed(items))
+            else:
+                parts.append(item.to_sql())
+        return "".join(parts)
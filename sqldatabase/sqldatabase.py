@@ -1,10 +1,12 @@
 from __future__ import annotations
-import copy
+import logging
 import pprint
 import sqlite3
 import textwrap
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections import deque
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from typing import Any, Generic, TypeVar
 
 import pyodbc  # type: ignore
@@ -18,7 +20,7 @@ from .sqlfunction import (
     SqlFunctions,
 )
 from .sqljoin import SqlJoin
-from .sqlrecord import SqlRecord
+from .sqlrecord import SqlRecord, SqlRowLayout
 from .sqlstatement import (
     ESqlOrderByType,
     SqlCreateTableStatement,
@@ -35,6 +37,8 @@ from .sqltranspiler import ESqlDialect
 
 T = TypeVar("T", bound=SqlTables)
 
+logger = logging.getLogger(__name__)
+
 
 class SqlDatabase(SqlBase, Generic[T]):
     """
@@ -44,11 +48,15 @@ class SqlDatabase(SqlBase, Generic[T]):
         dialect (ESqlDialect): The SQL dialect used by the database.
         tables (T): The tables in the database.
         default_schema_name (str | None): The default schema name for the database.
+        fetch_size (int): The number of rows fetched from the database at a time.
     """
 
     dialect: ESqlDialect
     tables: T
     default_schema_name: str | None = None
+    fetch_size: int = 1000
+    _ROW_LAYOUT_CACHE_SIZE = 128
+    _STATEMENT_CURSOR_CACHE_SIZE = 128
 
     def __init__(
         self,
@@ -76,21 +84,29 @@ class SqlDatabase(SqlBase, Generic[T]):
             self.tables = tables
         self.functions = SqlFunctions()
         self.attached_databases: dict[str, SqlDatabase] = {}
-        data_types = {}
+        self._row_layouts: dict[tuple[str, ...], SqlRowLayout] = {}
+        self._statement_cursors: dict[str, sqlite3.Cursor | pyodbc.Cursor] = {}
+        self._streaming_cursors: set[sqlite3.Cursor | pyodbc.Cursor] = set()
+        self._transaction_depth = 0
+        self._tables_by_name: dict[tuple[str | None, str], SqlTable] | None = None
+        self._tables_by_fully_qualified_name: dict[str, SqlTable] = {}
+        self._record_count_statements: dict[SqlTable, SqlSelectStatement] = {}
+        data_types: dict[str, SqlDataType] = {}
         for table in self.tables:
             table.database = self
             for column in table.columns:
+                data_type = column.data_type
                 assert isinstance(
-                    column.data_type, SqlDataType
-                ), f"Unexpected data type: {column.data_type}"
-                if isinstance(column.data_type, SqlDataTypeWithParameter):
-                    column.data_type.database = self
-                else:
-                    if column.data_type.name not in data_types:
-                        data_type = copy.deepcopy(column.data_type)
-                        data_type.database = self
-                        data_types[data_type.name] = data_type
-                    column.data_type = data_types[column.data_type.name]
+                    data_type, SqlDataType
+                ), f"Unexpected data type: {data_type}"
+                if isinstance(data_type, SqlDataTypeWithParameter):
+                    data_type.database = self
+                    continue
+                shared_data_type = data_types.get(data_type.name)
+                if shared_data_type is None:
+                    shared_data_type = data_types[data_type.name] = data_type.clone()
+                    shared_data_type.database = self
+                column.data_type = shared_data_type
 
     @property
     def autocommit(self) -> bool:
@@ -129,22 +145,74 @@ class SqlDatabase(SqlBase, Generic[T]):
             str: The fully qualified name of the table.
         """
 
-    def _fetch_records(self, cursor: sqlite3.Cursor | pyodbc.Cursor) -> list[SqlRecord]:
+    def _fetch_records(
+        self, cursor: sqlite3.Cursor | pyodbc.Cursor, fetch_size: int | None = None
+    ) -> list[SqlRecord]:
         """
         Fetch records from a database cursor.
 
         Args:
             cursor (sqlite3.Cursor | pyodbc.Cursor): The database cursor.
+            fetch_size (int | None, optional): The number of rows fetched at a time.
+                Defaults to None, which uses the fetch size of the database.
 
         Returns:
             list[SqlRecord]: The fetched records.
         """
-        records: list[SqlRecord] = []
-        if cursor.description is not None:
-            aliases = [description[0] for description in cursor.description]
-            for row in cursor.fetchall():
-                records.append(SqlRecord.from_database_row(aliases, row, self))
-        return records
+        return list(self._iter_records(cursor, fetch_size))
+
+    def _iter_records(
+        self, cursor: sqlite3.Cursor | pyodbc.Cursor, fetch_size: int | None = None
+    ) -> Iterator[SqlRecord]:
+        """
+        Iterate over records from a database cursor, fetching rows in chunks.
+
+        The whole result is never buffered. The cursor is marked as streaming
+        until the iteration is finished, so statements run meanwhile do not
+        reuse it.
+
+        Args:
+            cursor (sqlite3.Cursor | pyodbc.Cursor): The database cursor.
+            fetch_size (int | None, optional): The number of rows fetched at a time.
+                Defaults to None, which uses the fetch size of the database.
+
+        Yields:
+            SqlRecord: The fetched records.
+        """
+        if cursor.description is None:
+            return
+        if fetch_size is None:
+            fetch_size = self.fetch_size
+        assert fetch_size > 0, f"Invalid fetch size: {fetch_size}."
+        aliases = tuple(description[0] for description in cursor.description)
+        layout = self._get_row_layout(aliases)
+        self._streaming_cursors.add(cursor)
+        try:
+            while rows := cursor.fetchmany(fetch_size):
+                yield from SqlRecord.from_row_layout(layout, rows)
+        finally:
+            self._streaming_cursors.discard(cursor)
+
+    def _get_row_layout(self, aliases: tuple[str, ...]) -> SqlRowLayout:
+        """
+        Get the row layout for result set aliases, resolving it on first use.
+
+        Queries of the same shape return the same aliases, so their layouts are
+        cached. The oldest layout is evicted when the cache is full.
+
+        Args:
+            aliases (tuple[str, ...]): The aliases of the result set columns.
+
+        Returns:
+            SqlRowLayout: The item and the value converters for each alias.
+        """
+        layout = self._row_layouts.get(aliases)
+        if layout is None:
+            if len(self._row_layouts) >= self._ROW_LAYOUT_CACHE_SIZE:
+                del self._row_layouts[next(iter(self._row_layouts))]
+            layout = SqlRecord.get_row_layout(aliases, self)
+            self._row_layouts[aliases] = layout
+        return layout
 
     def _fetch_ids(self, cursor: sqlite3.Cursor | pyodbc.Cursor) -> list[int] | None:
         """
@@ -156,9 +224,12 @@ class SqlDatabase(SqlBase, Generic[T]):
         Returns:
             list[int] | None: The fetched IDs, or None if no IDs are found.
         """
-        if cursor.description is not None:
-            return [row[0] for row in cursor.fetchall()]
-        return None
+        if cursor.description is None:
+            return None
+        ids: list[int] = []
+        while rows := cursor.fetchmany(self.fetch_size):
+            ids.extend([row[0] for row in rows])
+        return ids
 
     def _execute_statement(
         self, statement: SqlStatement
@@ -172,7 +243,37 @@ class SqlDatabase(SqlBase, Generic[T]):
         Returns:
             sqlite3.Cursor | pyodbc.Cursor: The database cursor after execution.
         """
-        return self.execute(statement.sql, statement.parameters)
+        sql, parameters = statement.transpile_normalized()
+        return self.execute(sql, parameters, self._get_statement_cursor(sql))
+
+    def _get_statement_cursor(self, sql: str) -> sqlite3.Cursor | pyodbc.Cursor:
+        """
+        Get a cursor for executing a statement, reusing the one of the same SQL.
+
+        Executing the same SQL again on its cursor lets the driver skip preparing
+        the statement. While the result of the cached cursor is still being
+        streamed, a new cursor is returned instead, which is not cached. The
+        least recently used cursor is closed when the cache is full.
+
+        Args:
+            sql (str): The SQL of the statement.
+
+        Returns:
+            sqlite3.Cursor | pyodbc.Cursor: The cursor.
+        """
+        if self._statement_cursors.get(sql) in self._streaming_cursors:
+            return self._connection.cursor()
+        cursor = self._statement_cursors.pop(sql, None)
+        if cursor is None:
+            if len(self._statement_cursors) >= self._STATEMENT_CURSOR_CACHE_SIZE:
+                evicted_cursor = self._statement_cursors.pop(
+                    next(iter(self._statement_cursors))
+                )
+                if evicted_cursor not in self._streaming_cursors:
+                    evicted_cursor.close()
+            cursor = self._connection.cursor()
+        self._statement_cursors[sql] = cursor
+        return cursor
 
     def to_sql(self) -> str:
         """
@@ -187,6 +288,7 @@ class SqlDatabase(SqlBase, Generic[T]):
         self,
         sql: str,
         parameters: dict[str, Any] | Sequence = (),
+        cursor: sqlite3.Cursor | pyodbc.Cursor | None = None,
     ) -> sqlite3.Cursor | pyodbc.Cursor:
         """
         Execute a raw SQL query.
@@ -194,22 +296,62 @@ class SqlDatabase(SqlBase, Generic[T]):
         Args:
             sql (str): The SQL query to execute.
             parameters (dict[str, Any] | Sequence, optional): The parameters for the query. Defaults to ().
+            cursor (sqlite3.Cursor | pyodbc.Cursor | None, optional): The cursor to execute the query with,
+                so that repeated queries can reuse it. Defaults to None, which uses a new cursor.
 
         Returns:
             sqlite3.Cursor | pyodbc.Cursor: The database cursor after execution.
         """
-        print("=" * 80)
-        print("Executing SQL:")
-        print("-" * 80)
-        print(textwrap.indent(sql, "  "))
-        print()
-        print(
-            textwrap.indent(
-                f"parameters = {pprint.pformat(parameters, sort_dicts=False)}", "  "
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Executing SQL:\n%s\n\n%s",
+                textwrap.indent(sql, "  "),
+                textwrap.indent(
+                    f"parameters = {pprint.pformat(parameters, sort_dicts=False)}",
+                    "  ",
+                ),
             )
-        )
-        print()
-        return self._connection.execute(sql, parameters)
+        if cursor is None:
+            return self._connection.execute(sql, parameters)
+        return cursor.execute(sql, parameters)
+
+    def executemany(
+        self,
+        sql: str,
+        parameters: Sequence[dict[str, Any] | Sequence],
+        cursor: sqlite3.Cursor | pyodbc.Cursor | None = None,
+    ) -> sqlite3.Cursor | pyodbc.Cursor:
+        """
+        Execute a raw SQL query once for each set of parameters.
+
+        Args:
+            sql (str): The SQL query to execute.
+            parameters (Sequence[dict[str, Any] | Sequence]): The parameter sets for the query.
+            cursor (sqlite3.Cursor | pyodbc.Cursor | None, optional): The cursor to execute the query on.
+                Defaults to None, in which case a new batch cursor is created.
+
+        Returns:
+            sqlite3.Cursor | pyodbc.Cursor: The database cursor after execution.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Executing SQL:\n%s\n\n  parameter sets = %d",
+                textwrap.indent(sql, "  "),
+                len(parameters),
+            )
+        if cursor is None:
+            cursor = self._create_batch_cursor()
+        cursor.executemany(sql, parameters)
+        return cursor
+
+    def _create_batch_cursor(self) -> sqlite3.Cursor | pyodbc.Cursor:
+        """
+        Create a cursor for executing a query with many parameter sets.
+
+        Returns:
+            sqlite3.Cursor | pyodbc.Cursor: The cursor.
+        """
+        return self._connection.cursor()
 
     def commit(self) -> None:
         """
@@ -223,10 +365,92 @@ class SqlDatabase(SqlBase, Generic[T]):
         """
         self._connection.rollback()
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Run the statements of a block in one transaction.
+
+        The transaction is committed when the block ends and rolled back if it
+        raises, so a loop of writes pays for a single commit. In autocommit mode
+        it is disabled for the duration of the block. Statements already pending
+        when the outermost block starts belong to the same transaction, so they
+        are committed or rolled back together with the block.
+
+        Blocks can be nested: a nested block runs inside a savepoint, which is
+        released when it ends and rolled back to if it raises, without ending
+        the enclosing transaction.
+
+        Yields:
+            None
+        """
+        if self._transaction_depth:
+            yield from self._nested_transaction()
+            return
+        autocommit = self.autocommit
+        if autocommit:
+            self._connection.autocommit = False
+        self._transaction_depth = 1
+        try:
+            yield
+        except BaseException:
+            self.rollback()
+            raise
+        else:
+            self.commit()
+        finally:
+            self._transaction_depth = 0
+            if autocommit:
+                self._connection.autocommit = True
+
+    def _nested_transaction(self) -> Iterator[None]:
+        savepoint_name = f"transaction_{self._transaction_depth}"
+        self._create_savepoint(savepoint_name)
+        self._transaction_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._rollback_to_savepoint(savepoint_name)
+            raise
+        else:
+            self._release_savepoint(savepoint_name)
+        finally:
+            self._transaction_depth -= 1
+
+    def _create_savepoint(self, savepoint_name: str) -> None:
+        """
+        Create a savepoint in the current transaction.
+
+        Args:
+            savepoint_name (str): The name of the savepoint.
+        """
+        self._connection.execute(f"SAVEPOINT {savepoint_name}")
+
+    def _release_savepoint(self, savepoint_name: str) -> None:
+        """
+        Release a savepoint, keeping its changes in the current transaction.
+
+        Args:
+            savepoint_name (str): The name of the savepoint.
+        """
+        self._connection.execute(f"RELEASE SAVEPOINT {savepoint_name}")
+
+    def _rollback_to_savepoint(self, savepoint_name: str) -> None:
+        """
+        Roll back the changes made since a savepoint and release it.
+
+        Args:
+            savepoint_name (str): The name of the savepoint.
+        """
+        self._connection.execute(f"ROLLBACK TO SAVEPOINT {savepoint_name}")
+        self._release_savepoint(savepoint_name)
+
     def close(self) -> None:
         """
         Close the database connection.
         """
+        for cursor in self._statement_cursors.values():
+            cursor.close()
+        self._statement_cursors.clear()
         self._connection.close()
 
     def create_table(self, table: SqlTable, if_not_exists: bool = False) -> None:
@@ -248,9 +472,9 @@ class SqlDatabase(SqlBase, Generic[T]):
         Args:
             if_not_exists (bool, optional): Whether to skip creation if the tables already exist. Defaults to False.
         """
-        for table in self.tables:
-            self.create_table(table, if_not_exists)
-        self.commit()
+        with self.transaction():
+            for table in self.tables:
+                self.create_table(table, if_not_exists)
 
     def drop_table(self, table: SqlTable, if_exists: bool = False) -> None:
         """
@@ -269,22 +493,37 @@ class SqlDatabase(SqlBase, Generic[T]):
         Args:
             if_exists (bool, optional): Whether to skip dropping if the tables do not exist. Defaults to False.
         """
-        unsorted_tables = set(self.tables)
+        # Tables are dropped before the tables they reference (Kahn's algorithm).
+        tables = list(self.tables)
+        referencing_table_counts = dict.fromkeys(tables, 0)
+        referenced_tables: dict[SqlTable, list[SqlTable]] = {}
+        for table in tables:
+            referenced_tables[table] = [
+                referenced_table
+                for referenced_table in table.referenced_tables
+                if referenced_table is not table
+                and referenced_table in referencing_table_counts
+            ]
+            for referenced_table in referenced_tables[table]:
+                referencing_table_counts[referenced_table] += 1
+
+        queue = deque(table for table in tables if referencing_table_counts[table] == 0)
         sorted_tables: list[SqlTable] = []
+        while queue:
+            table = queue.popleft()
+            sorted_tables.append(table)
+            for referenced_table in referenced_tables[table]:
+                referencing_table_counts[referenced_table] -= 1
+                if referencing_table_counts[referenced_table] == 0:
+                    queue.append(referenced_table)
+        # Tables in reference cycles cannot be ordered, so they are dropped last.
+        sorted_tables.extend(
+            table for table in tables if referencing_table_counts[table] > 0
+        )
 
-        while unsorted_tables:
-            referenced_tables = set()
-            for table in unsorted_tables:
-                for referenced_table in table.referenced_tables:
-                    referenced_tables.add(referenced_table)
-            unreferenced_tables = set(unsorted_tables) - set(referenced_tables)
-            sorted_tables.extend(unreferenced_tables)
-            unsorted_tables = referenced_tables
-
-        for table in sorted_tables:
-            self.drop_table(table, if_exists)
-
-        self.commit()
+        with self.transaction():
+            for table in sorted_tables:
+                self.drop_table(table, if_exists)
 
     def get_table(self, table_fully_qualified_name: str) -> SqlTable:
         """
@@ -299,6 +538,9 @@ class SqlDatabase(SqlBase, Generic[T]):
         Raises:
             AssertionError: If the table is not found.
         """
+        table = self._tables_by_fully_qualified_name.get(table_fully_qualified_name)
+        if table is not None:
+            return table
         database_name, schema_name, table_name = self._parse_table_fully_qualified_name(
             table_fully_qualified_name
         )
@@ -306,17 +548,24 @@ class SqlDatabase(SqlBase, Generic[T]):
             database = self.attached_databases[database_name]
         else:
             database = self
-        for table in database.tables:
-            if table.name == table_name and table.schema_name == schema_name:
-                return table
+        if database._tables_by_name is None:
+            database._tables_by_name = {
+                (table.schema_name, table.name): table for table in database.tables
+            }
+        table = database._tables_by_name.get((schema_name, table_name))
         assert (
-            False
+            table is not None
         ), f"Table '{table_name}', schema '{schema_name}', not found in database '{database.name}'."
+        if database is self:
+            # Attached databases may change, so only own tables are remembered.
+            self._tables_by_fully_qualified_name[table_fully_qualified_name] = table
+        return table
 
     def insert_records(
         self,
         table: SqlTable,
         records: SqlRecord | Sequence[SqlRecord],
+        batch_size: int | None = None,
     ) -> list[int] | None:
         """
         Insert records into a table.
@@ -324,6 +573,8 @@ class SqlDatabase(SqlBase, Generic[T]):
         Args:
             table (SqlTable): The table to insert records into.
             records (SqlRecord | Sequence[SqlRecord]): The records to insert.
+            batch_size (int | None, optional): The maximum number of records sent in one batch
+                when no IDs are returned. Defaults to None, in which case all records are sent at once.
 
         Returns:
             list[int] | None: The IDs of the inserted records, or None if no IDs are generated.
@@ -332,20 +583,62 @@ class SqlDatabase(SqlBase, Generic[T]):
             records = [records]
 
         insert_statement = SqlInsertIntoStatement(self.dialect, table, records[0])
+        sql, parameters = insert_statement.transpile_normalized()
+        # The insert template binds one parameter per column, in record order, so
+        # the other records are bound the same way without transpiling again.
+        parameter_names = list(parameters) if isinstance(parameters, dict) else None
+        cursor = self.execute(sql, parameters, self._connection.cursor())
+        if cursor.description is None:
+            # Nothing to fetch per record, so insert the rest in batches.
+            if len(records) > 1:
+                assert (
+                    batch_size is None or batch_size > 0
+                ), f"Invalid batch size: {batch_size}."
+                step = batch_size or len(records)
+                batch_cursor = self._create_batch_cursor()
+                for start in range(1, len(records), step):
+                    self.executemany(
+                        sql,
+                        [
+                            self._get_insert_parameters(parameter_names, record)
+                            for record in records[start : start + step]
+                        ],
+                        batch_cursor,
+                    )
+            return None
+
         ids = []
         for index, record in enumerate(records):
-            if index > 0 and insert_statement.template_parameters is not None:
-                for parameter, value in zip(
-                    insert_statement.template_parameters.keys(), record.values()
-                ):
-                    insert_statement.template_parameters[parameter] = value
-            cursor = self._execute_statement(insert_statement)
-            if cursor.description is not None:
-                row = cursor.fetchone()
-                if row is not None:
-                    ids.append(row[0])
+            if index > 0:
+                self.execute(
+                    sql, self._get_insert_parameters(parameter_names, record), cursor
+                )
+            row = cursor.fetchone()
+            if row is not None:
+                ids.append(row[0])
         return ids if len(ids) else None
 
+    @staticmethod
+    def _get_insert_parameters(
+        parameter_names: Sequence[str] | None, record: SqlRecord
+    ) -> dict[str, Any] | tuple:
+        """
+        Get the parameters of an insert statement for another record.
+
+        Args:
+            parameter_names (Sequence[str] | None): The names of the statement parameters
+                in column order, or None if the dialect binds parameters by position.
+            record (SqlRecord): The record with the same columns as the statement.
+
+        Returns:
+            dict[str, Any] | tuple: The parameters for the record.
+        """
+        to_database_value = SqlRecord.to_database_value
+        values = [to_database_value(item, value) for item, value in record.items()]
+        if parameter_names is None:
+            return tuple(values)
+        return dict(zip(parameter_names, values))
+
     def select_records(
         self,
         table: SqlTable,
@@ -450,6 +743,13 @@ class SqlDatabase(SqlBase, Generic[T]):
         Returns:
             int: The count of records in the table.
         """
-        count_function = self.functions.COUNT()
-        records = self.select_records(table, count_function)
-        return records[0][count_function]
+        # The statement has no parameters, so it is built once per table.
+        select_statement = self._record_count_statements.get(table)
+        if select_statement is None:
+            select_statement = SqlSelectStatement(
+                self.dialect, table, self.functions.COUNT()
+            )
+            self._record_count_statements[table] = select_statement
+        cursor = self._execute_statement(select_statement)
+        # Fetch all rows so the cached cursor is left without pending results.
+        return cursor.fetchall()[0][0]
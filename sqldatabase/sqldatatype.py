@@ -1,5 +1,8 @@
 from __future__ import annotations
+import copy
 import datetime
+import operator
+import types
 from typing import TYPE_CHECKING, Any, Callable
 
 from shared import EnumLikeMixedContainer
@@ -8,6 +11,36 @@ from .sqlbase import SqlBase
 
 if TYPE_CHECKING:
     from .sqldatabase import SqlDatabase
+    from .sqlitedatabase import SqliteDatabase
+    from .sqlserverdatabase import SqlServerDatabase
+
+# These modules import this one, so the classes are resolved on first use.
+_SqliteDatabase: type[SqliteDatabase] | None = None
+_SqlServerDatabase: type[SqlServerDatabase] | None = None
+
+
+def _late_bind() -> None:
+    global _SqliteDatabase, _SqlServerDatabase
+    from .sqlitedatabase import SqliteDatabase
+    from .sqlserverdatabase import SqlServerDatabase
+
+    _SqliteDatabase = SqliteDatabase
+    _SqlServerDatabase = SqlServerDatabase
+
+
+_to_isoformat = operator.methodcaller("isoformat")
+
+
+def _is_sqlite_database(database: SqlDatabase | None) -> bool:
+    if _SqliteDatabase is None:
+        _late_bind()
+    return isinstance(database, _SqliteDatabase)
+
+
+def _is_sql_server_database(database: SqlDatabase | None) -> bool:
+    if _SqlServerDatabase is None:
+        _late_bind()
+    return isinstance(database, _SqlServerDatabase)
 
 
 class SqlDataType(SqlBase):
@@ -21,8 +54,6 @@ class SqlDataType(SqlBase):
         from_database_converter (Callable[[Any], Any] | None): Function to convert values from database format.
     """
 
-    database: SqlDatabase
-
     def __init__(
         self,
         name: str,
@@ -44,6 +75,57 @@ class SqlDataType(SqlBase):
         self.to_database_converter = to_database_converter
         self.from_database_converter = from_database_converter
 
+    @property
+    def database(self) -> SqlDatabase:
+        """
+        Get the database the data type is bound to.
+
+        Returns:
+            SqlDatabase: The database.
+        """
+        return self._database
+
+    @database.setter
+    def database(self, database: SqlDatabase) -> None:
+        """
+        Bind the data type to a database.
+
+        Args:
+            database (SqlDatabase): The database.
+        """
+        self._database = database
+        self._bind_database(database)
+
+    def _bind_database(self, database: SqlDatabase) -> None:
+        """
+        Specialize the data type for the database it is bound to.
+
+        Data types whose SQL or conversions differ between databases resolve them
+        here once, instead of checking the database on every call.
+
+        Args:
+            database (SqlDatabase): The database.
+        """
+
+    def clone(self) -> SqlDataType:
+        """
+        Create a shallow copy of the data type.
+
+        Converters that are methods of the data type are rebound to the copy, so
+        they see the database the copy is bound to.
+
+        Returns:
+            SqlDataType: The copy of the data type.
+        """
+        data_type = copy.copy(self)
+        for name in ("to_database_converter", "from_database_converter"):
+            converter = getattr(self, name)
+            if isinstance(converter, types.MethodType) and converter.__self__ is self:
+                setattr(
+                    data_type, name, types.MethodType(converter.__func__, data_type)
+                )
+        return data_type
+
     def to_sql(self) -> str:
         """
         Convert the data type to its SQL representation.
@@ -115,19 +197,21 @@ class SqlTextDataType(SqlDataType):
         """Initialize a SqlTextDataType instance."""
         SqlDataType.__init__(self, "TEXT", str)
 
+    def _bind_database(self, database: SqlDatabase) -> None:
+        """Resolve the SQL of the TEXT data type for the database.
+
+        Args:
+            database (SqlDatabase): The database.
+        """
+        self._sql = "NVARCHAR(255)" if _is_sql_server_database(database) else self.name
+
     def to_sql(self) -> str:
         """Convert the TEXT data type to its SQL representation.
 
         Returns:
             str: The SQL representation of the TEXT data type.
         """
-        from .sqlserverdatabase import SqlServerDatabase
-
-        return (
-            "NVARCHAR(255)"
-            if isinstance(self.database, SqlServerDatabase)
-            else self.name
-        )
+        return self._sql
 
 
 class SqlBlobDataType(SqlDataType):
@@ -144,21 +228,23 @@ class SqlBooleanDataType(SqlDataType):
     def __init__(self) -> None:
         """Initialize a SqlBooleanDataType instance."""
         SqlDataType.__init__(
-            self, "BOOLEAN", bool, self._to_database_value, self._from_database_value
+            self, "BOOLEAN", bool, from_database_converter=self._from_database_value
         )
 
-    def _to_database_value(self, value: bool) -> bool | int:
-        """Convert a boolean value to its database representation.
+    def _bind_database(self, database: SqlDatabase) -> None:
+        """Resolve the SQL and database conversion of the BOOLEAN data type.
 
-        Args:
-            value (bool): The boolean value to convert.
+        SQLite has no boolean type, so booleans are stored as integers.
 
-        Returns:
-            bool | int: The database representation of the boolean value.
+        Args:
+            database (SqlDatabase): The database.
         """
-        from .sqlitedatabase import SqliteDatabase
-
-        return int(value) if isinstance(self.database, SqliteDatabase) else value
+        if _is_sqlite_database(database):
+            self._sql = "INTEGER"
+            self.to_database_converter = int
+        else:
+            self._sql = self.name
+            self.to_database_converter = None
 
     def _from_database_value(self, value: bool | int) -> bool:
         """Convert a database value to a boolean.
@@ -177,9 +263,7 @@ class SqlBooleanDataType(SqlDataType):
         Returns:
             str: The SQL representation of the BOOLEAN data type.
         """
-        from .sqlitedatabase import SqliteDatabase
-
-        return "INTEGER" if isinstance(self.database, SqliteDatabase) else self.name
+        return self._sql
 
 
 class SqlDateDataType(SqlDataType):
@@ -191,22 +275,23 @@ class SqlDateDataType(SqlDataType):
             self,
             "DATE",
             datetime.date,
-            self._to_database_value,
-            self._from_database_value,
+            from_database_converter=self._from_database_value,
         )
 
-    def _to_database_value(self, value: datetime.date) -> datetime.date | str:
-        """Convert a date value to its database representation.
+    def _bind_database(self, database: SqlDatabase) -> None:
+        """Resolve the SQL and database conversion of the DATE data type.
 
-        Args:
-            value (datetime.date): The date value to convert.
+        SQLite has no date type, so values are stored as ISO format text.
 
-        Returns:
-            datetime.date | str: The database representation of the date value.
+        Args:
+            database (SqlDatabase): The database.
         """
-        from .sqlitedatabase import SqliteDatabase
-
-        return value.isoformat() if isinstance(self.database, SqliteDatabase) else value
+        if _is_sqlite_database(database):
+            self._sql = "TEXT"
+            self.to_database_converter = _to_isoformat
+        else:
+            self._sql = self.name
+            self.to_database_converter = None
 
     def _from_database_value(self, value: datetime.date | str) -> datetime.date:
         """Convert a database value to a date.
@@ -225,9 +310,7 @@ class SqlDateDataType(SqlDataType):
         Returns:
             str: The SQL representation of the DATE data type.
         """
-        from .sqlitedatabase import SqliteDatabase
-
-        return "TEXT" if isinstance(self.database, SqliteDatabase) else self.name
+        return self._sql
 
 
 class SqlTimeDataType(SqlDataType):
@@ -239,22 +322,23 @@ class SqlTimeDataType(SqlDataType):
             self,
             "TIME",
             datetime.date,
-            self._to_database_value,
-            self._from_database_value,
+            from_database_converter=self._from_database_value,
         )
 
-    def _to_database_value(self, value: datetime.time) -> datetime.time | str:
-        """Convert a time value to its database representation.
+    def _bind_database(self, database: SqlDatabase) -> None:
+        """Resolve the SQL and database conversion of the TIME data type.
 
-        Args:
-            value (datetime.time): The time value to convert.
+        SQLite has no time type, so values are stored as ISO format text.
 
-        Returns:
-            datetime.time | str: The database representation of the time value.
+        Args:
+            database (SqlDatabase): The database.
         """
-        from .sqlitedatabase import SqliteDatabase
-
-        return value.isoformat() if isinstance(self.database, SqliteDatabase) else value
+        if _is_sqlite_database(database):
+            self._sql = "TEXT"
+            self.to_database_converter = _to_isoformat
+        else:
+            self._sql = self.name
+            self.to_database_converter = None
 
     def _from_database_value(self, value: datetime.time | str) -> datetime.time:
         """Convert a database value to a time.
@@ -273,9 +357,7 @@ class SqlTimeDataType(SqlDataType):
         Returns:
             str: The SQL representation of the TIME data type.
         """
-        from .sqlitedatabase import SqliteDatabase
-
-        return "TEXT" if isinstance(self.database, SqliteDatabase) else self.name
+        return self._sql
 
 
 class SqlDateTimeDataType(SqlDataType):
@@ -287,22 +369,23 @@ class SqlDateTimeDataType(SqlDataType):
             self,
             "DATETIME",
             datetime.date,
-            self._to_database_value,
-            self._from_database_value,
+            from_database_converter=self._from_database_value,
         )
 
-    def _to_database_value(self, value: datetime.datetime) -> datetime.datetime | str:
-        """Convert a datetime value to its database representation.
+    def _bind_database(self, database: SqlDatabase) -> None:
+        """Resolve the SQL and database conversion of the DATETIME data type.
 
-        Args:
-            value (datetime.datetime): The datetime value to convert.
+        SQLite has no datetime type, so values are stored as ISO format text.
 
-        Returns:
-            datetime.datetime | str: The database representation of the datetime value.
+        Args:
+            database (SqlDatabase): The database.
         """
-        from .sqlitedatabase import SqliteDatabase
-
-        return value.isoformat() if isinstance(self.database, SqliteDatabase) else value
+        if _is_sqlite_database(database):
+            self._sql = "TEXT"
+            self.to_database_converter = _to_isoformat
+        else:
+            self._sql = self.name
+            self.to_database_converter = None
 
     def _from_database_value(self, value: datetime.datetime | str) -> datetime.datetime:
         """Convert a database value to a datetime.
@@ -323,9 +406,7 @@ class SqlDateTimeDataType(SqlDataType):
         Returns:
             str: The SQL representation of the DATETIME data type.
         """
-        from .sqlitedatabase import SqliteDatabase
-
-        return "TEXT" if isinstance(self.database, SqliteDatabase) else self.name
+        return self._sql
 
 
 class SqlDataTypes(EnumLikeMixedContainer[SqlDataType]):
@@ -1,5 +1,5 @@
 from __future__ import annotations
-import uuid
+import itertools
 from typing import TYPE_CHECKING, Any, Callable
 
 from shared import EnumLikeClassContainer
@@ -20,8 +20,12 @@ class SqlAggregateFunction(SqlBase):
         column (SqlColumn | None): The column the function operates on.
     """
 
+    __slots__ = ("column",)
+
     name: str
 
+    _parameter_counter = itertools.count()
+
     def __init__(self, column: SqlColumn | None = None):
         """
         Initialize a SqlAggregateFunction instance.
@@ -35,10 +39,13 @@ class SqlAggregateFunction(SqlBase):
         self.column = column
 
     def __eq__(self, other: Any) -> bool:
-        return (
-            isinstance(other, SqlAggregateFunction)
-            and self.fully_qualified_name == other.fully_qualified_name
-        )
+        if self is other:
+            return True
+        if not isinstance(other, SqlAggregateFunction) or self.name != other.name:
+            return False
+        if self.column is other.column:
+            return True
+        return self.fully_qualified_name == other.fully_qualified_name
 
     def __hash__(self):
         return hash(self.fully_qualified_name)
@@ -89,7 +96,7 @@ class SqlAggregateFunction(SqlBase):
 
     def generate_parameter_name(self) -> str:
         if self.column is None:
-            return f"{self.name}_{uuid.uuid4().hex[:8]}"
+            return f"{self.name}_{next(SqlAggregateFunction._parameter_counter):x}"
         else:
             return f"{self.name}_{self.column.generate_parameter_name()}"
 
@@ -101,12 +108,16 @@ class SqlAggregateFunction(SqlBase):
 
 
 class SqlCount(SqlAggregateFunction):
+    __slots__ = ()
+
     name = "count"
 
 
 class SqlAggregateFunctionWithMandatoryColumn(SqlAggregateFunction):
     """Represents a SQL aggregate function that requires a column."""
 
+    __slots__ = ()
+
     def __init__(self, column: SqlColumn):
         """Initialize a SqlAggregateFunctionWithMandatoryColumn instance.
 
@@ -119,24 +130,32 @@ class SqlAggregateFunctionWithMandatoryColumn(SqlAggregateFunction):
 class SqlMin(SqlAggregateFunctionWithMandatoryColumn):
     """Represents the SQL MIN aggregate function."""
 
+    __slots__ = ()
+
     name = "min"
 
 
 class SqlMax(SqlAggregateFunctionWithMandatoryColumn):
     """Represents the SQL MAX aggregate function."""
 
+    __slots__ = ()
+
     name = "max"
 
 
 class SqlSum(SqlAggregateFunctionWithMandatoryColumn):
     """Represents the SQL SUM aggregate function."""
 
+    __slots__ = ()
+
     name = "sum"
 
 
 class SqlAvg(SqlAggregateFunctionWithMandatoryColumn):
     """Represents the SQL AVG aggregate function."""
 
+    __slots__ = ()
+
     name = "avg"
 
 
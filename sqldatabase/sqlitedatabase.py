@@ -12,27 +12,93 @@ class SqliteDataTypes(SqlDataTypes):
     """Represents SQLite-specific data types."""
 
 
+# Values accepted for the PRAGMAs that can be set when a connection is opened,
+# integer PRAGMAs are mapped to int. PRAGMA statements cannot take parameters, so
+# names and values are checked against this list before being formatted in.
+PRAGMA_VALUES: dict[str, frozenset[str] | type[int]] = {
+    "journal_mode": frozenset(
+        ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+    ),
+    "synchronous": frozenset(("OFF", "NORMAL", "FULL", "EXTRA", "0", "1", "2", "3")),
+    "temp_store": frozenset(("DEFAULT", "FILE", "MEMORY", "0", "1", "2")),
+    "cache_size": int,
+    "mmap_size": int,
+}
+
+
 class SqliteDatabase(SqlDatabase[T], Generic[T]):
     """Represents a SQLite database.
 
     Attributes:
         dialect (ESqlDialect): The SQL dialect used by the database.
+        fast_pragmas (dict[str, str | int]): PRAGMAs trading durability for speed, to be
+            passed explicitly as pragmas. WAL journaling with NORMAL synchronization
+            avoids an fsync per commit, but the last commits may be lost on power failure.
         path (Path): The file path to the SQLite database.
     """
 
     dialect = ESqlDialect.SQLITE
-
-    def __init__(self, path: str | Path, autocommit: bool = False):
+    fast_pragmas: dict[str, str | int] = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "cache_size": -65536,
+    }
+
+    def __init__(
+        self,
+        path: str | Path,
+        autocommit: bool = False,
+        pragmas: dict[str, str | int] | None = None,
+    ):
         """Initialize a SqliteDatabase instance.
 
         Args:
             path (str | Path): The file path to the SQLite database.
             autocommit (bool, optional): Whether to enable autocommit mode. Defaults to False.
+            pragmas (dict[str, str | int] | None, optional): PRAGMAs applied when the connection
+                is opened, e.g. SqliteDatabase.fast_pragmas. Only the PRAGMAs and values
+                listed in PRAGMA_VALUES are accepted. Defaults to None, which keeps the
+                SQLite defaults.
+
+        Raises:
+            ValueError: If a PRAGMA or its value is not listed in PRAGMA_VALUES.
         """
+        pragmas = pragmas or {}
+        for name, value in pragmas.items():
+            self._validate_pragma(name, value)
         self.path = Path(path)
-        connection = sqlite3.connect(self.path, autocommit=autocommit)
+        # The journal mode cannot change inside a transaction, so the PRAGMAs are
+        # applied before autocommit is disabled.
+        connection = sqlite3.connect(self.path, autocommit=True)
+        for name, value in pragmas.items():
+            connection.execute(f"PRAGMA {name} = {value}").fetchall()
+        connection.autocommit = autocommit
         SqlDatabase.__init__(self, "main", connection)
 
+    @staticmethod
+    def _validate_pragma(name: str, value: str | int) -> None:
+        """Check a PRAGMA name and value against PRAGMA_VALUES.
+
+        Args:
+            name (str): The name of the PRAGMA.
+            value (str | int): The value of the PRAGMA.
+
+        Raises:
+            ValueError: If the PRAGMA or its value is not listed in PRAGMA_VALUES.
+        """
+        # Not asserted: the value is formatted into the statement, so the check
+        # must also run under python -O.
+        if name not in PRAGMA_VALUES:
+            raise ValueError(f"Unsupported PRAGMA: {name}.")
+        values = PRAGMA_VALUES[name]
+        if values is int:
+            valid = type(value) is int
+        else:
+            valid = str(value).upper() in values  # type: ignore
+        if not valid:
+            raise ValueError(f"Invalid value for PRAGMA {name}: {value!r}.")
+
     def _parse_table_fully_qualified_name(
         self,
         table_fully_qualified_name: str,
@@ -1,8 +1,8 @@
 from __future__ import annotations
 import base64
 import datetime
-from collections.abc import ItemsView, KeysView, MutableMapping, ValuesView
-from typing import TYPE_CHECKING, Any, Iterator
+from collections.abc import ItemsView, KeysView, MutableMapping, Sequence, ValuesView
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 import pyodbc  # type: ignore
 
@@ -12,6 +12,11 @@ from .sqlfunction import SqlAggregateFunction, SqlAggregateFunctionWithMandatory
 if TYPE_CHECKING:
     from .sqldatabase import SqlDatabase
 
+# Item and value converters for each value of a database row.
+SqlRowLayout = tuple[
+    list[SqlColumn | SqlAggregateFunction], list[tuple[Callable[[Any], Any], ...]]
+]
+
 
 class SqlRecord(MutableMapping):
     """Represents a record in a SQL table.
@@ -43,6 +48,8 @@ class SqlRecord(MutableMapping):
         Returns:
             bool: True if the instances are equal, False otherwise.
         """
+        if self is other:
+            return True
         return isinstance(other, SqlRecord) and self._data == other._data
 
     def __getitem__(self, key: SqlColumn | SqlAggregateFunction | int) -> Any:
@@ -292,6 +299,91 @@ class SqlRecord(MutableMapping):
             record[item] = cls.from_database_value(item, value)
         return record
 
+    @classmethod
+    def get_row_layout(
+        cls, aliases: Sequence[str], database: SqlDatabase
+    ) -> SqlRowLayout:
+        """Resolve the items and value converters of database rows.
+
+        The layout only depends on the aliases, so it can be reused for all rows
+        of a result set and for other result sets with the same aliases.
+
+        Args:
+            aliases (Sequence[str]): The aliases of the row values.
+            database (SqlDatabase): The database instance.
+
+        Returns:
+            SqlRowLayout: The item and the value converters for each alias.
+        """
+        items = [cls._get_item_by_alias(alias, database) for alias in aliases]
+        converters = [cls._get_from_database_converters(item) for item in items]
+        return items, converters
+
+    @classmethod
+    def from_row_layout(
+        cls,
+        layout: SqlRowLayout,
+        rows: list[tuple] | list[pyodbc.Row],
+    ) -> list[SqlRecord]:
+        """Create SqlRecord instances from database rows with a resolved layout.
+
+        Args:
+            layout (SqlRowLayout): The layout returned by get_row_layout.
+            rows (list[tuple] | list[pyodbc.Row]): The database rows.
+
+        Returns:
+            list[SqlRecord]: The created SqlRecord instances.
+        """
+        items, converters = layout
+        if not any(converters):
+            return [cls._from_data(dict(zip(items, row))) for row in rows]
+
+        records = []
+        for row in rows:
+            data = {}
+            for item, item_converters, value in zip(items, converters, row):
+                for converter in item_converters:
+                    value = converter(value)
+                data[item] = value
+            records.append(cls._from_data(data))
+        return records
+
+    @classmethod
+    def _from_data(cls, data: dict[SqlColumn | SqlAggregateFunction, Any]) -> SqlRecord:
+        """Create a SqlRecord instance from already validated data.
+
+        Args:
+            data (dict[SqlColumn | SqlAggregateFunction, Any]): The data for the record.
+
+        Returns:
+            SqlRecord: The created SqlRecord instance.
+        """
+        record = cls.__new__(cls)
+        record._data = data
+        return record
+
+    @staticmethod
+    def _get_from_database_converters(
+        item: SqlColumn | SqlAggregateFunction,
+    ) -> tuple[Callable[[Any], Any], ...]:
+        """Get the converters applied to a value read from the database.
+
+        Args:
+            item (SqlColumn | SqlAggregateFunction): The item associated with the value.
+
+        Returns:
+            tuple[Callable[[Any], Any], ...]: The converters in the order they are applied.
+        """
+        converters = []
+        if (
+            item.data_type is not None
+            and item.data_type.from_database_converter is not None
+        ):
+            converters.append(item.data_type.from_database_converter)
+        if item.from_database_converter is not None:
+            converters.append(item.from_database_converter)
+        return tuple(converters)
+
     @staticmethod
     def to_json_value(item: SqlColumn | SqlAggregateFunction, value: Any) -> Any:
         """Convert a value to its JSON representation.
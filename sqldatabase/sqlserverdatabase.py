@@ -98,6 +98,49 @@ class SqlServerDatabase(SqlDatabase[T], Generic[T]):
         connection = pyodbc.connect(self.connection_string, autocommit=autocommit)
         SqlDatabase.__init__(self, database, connection)
 
+    def _create_batch_cursor(self) -> pyodbc.Cursor:
+        """Create a cursor for executing a query with many parameter sets.
+
+        The parameter sets are sent to the server in arrays instead of one
+        round trip per set.
+
+        Returns:
+            pyodbc.Cursor: The cursor.
+        """
+        cursor = self._connection.cursor()
+        cursor.fast_executemany = True
+        return cursor
+
+    def _create_savepoint(self, savepoint_name: str) -> None:
+        """Create a savepoint in the current transaction.
+
+        With autocommit disabled the transaction is only started by the first
+        statement, so it is started explicitly if none is active yet.
+
+        Args:
+            savepoint_name (str): The name of the savepoint.
+        """
+        self._connection.execute(
+            "IF @@TRANCOUNT = 0 BEGIN TRANSACTION;"
+            f" SAVE TRANSACTION {savepoint_name};"
+        )
+
+    def _release_savepoint(self, savepoint_name: str) -> None:
+        """Release a savepoint. SQL Server savepoints cannot be released, so
+        they are kept until the transaction ends.
+
+        Args:
+            savepoint_name (str): The name of the savepoint.
+        """
+
+    def _rollback_to_savepoint(self, savepoint_name: str) -> None:
+        """Roll back the changes made since a savepoint.
+
+        Args:
+            savepoint_name (str): The name of the savepoint.
+        """
+        self._connection.execute(f"ROLLBACK TRANSACTION {savepoint_name}")
+
     def _parse_table_fully_qualified_name(
         self, table_fully_qualified_name: str
     ) -> tuple[str | None, str | None, str | None]:
@@ -64,19 +64,25 @@ class SqlStatement(SqlBase):
         self.context["parameters"] = parameters
         self.template_parameters = parameters or {}
         self.template_sql = self._render_template()
+        self._sql: str | None = None
 
     @property
     def sql(self) -> str:
         """Get the SQL representation of the statement.
 
+        The template does not change after the statement is created, so it is
+        transpiled on first use and the result is reused afterwards.
+
         Returns:
             str: The SQL representation of the statement.
         """
-        return SqlTranspiler(self.dialect).transpile_sql(
-            self.template_sql,
-            self.template_dialect,
-            pretty=True,
-        )
+        if self._sql is None:
+            self._sql = SqlTranspiler(self.dialect).transpile_sql(
+                self.template_sql,
+                self.template_dialect,
+                pretty=True,
+            )
+        return self._sql
 
     @property
     def parameters(self) -> dict[str, Any] | Sequence:
@@ -90,6 +96,22 @@ class SqlStatement(SqlBase):
             self.template_parameters,
         )
 
+    def transpile_normalized(self) -> tuple[str, dict[str, Any] | Sequence]:
+        """Get the SQL and parameters of the statement with parameters named by position.
+
+        Statements of the same shape share the SQL, unlike sql, whose parameter
+        names are unique to the statement.
+
+        Returns:
+            tuple[str, dict[str, Any] | Sequence]: The SQL and parameters of the statement.
+        """
+        return SqlTranspiler(self.dialect).transpile_normalized(
+            self.template_sql,
+            self.template_parameters,
+            self.template_dialect,
+            pretty=True,
+        )
+
     def _render_template(self) -> str:
         """Render the SQL template.
 
@@ -217,9 +239,9 @@ class SqlSelectStatement(SqlStatement):
         """
         parameters = {}
         if where_condition:
-            parameters.update(where_condition.parameters)
+            parameters.update(where_condition.parameter_items())
         if having_condition:
-            parameters.update(having_condition.parameters)
+            parameters.update(having_condition.parameter_items())
         preprocessed_items = self._preprocess_items(table, *items)
         preprocessed_order_by_items = self._preprocess_order_by_items(order_by_items)
 
@@ -325,7 +347,7 @@ class SqlUpdateStatement(SqlStatement):
             where_condition (SqlCondition): The WHERE condition.
         """
         parameters = record.to_database_parameters()
-        parameters.update(where_condition.parameters)
+        parameters.update(where_condition.parameter_items())
         columns_and_parameters = list(zip(record.keys(), parameters))
         SqlStatement.__init__(
             self,
@@ -355,7 +377,7 @@ class SqlDeleteStatement(SqlStatement):
             table (SqlTable): The table to delete from.
             where_condition (SqlCondition): The WHERE condition.
         """
-        parameters = where_condition.parameters
+        parameters = dict(where_condition.parameter_items())
         SqlStatement.__init__(
             self,
             dialect,
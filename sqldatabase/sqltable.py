@@ -157,10 +157,10 @@ class SqlTable(SqlBase, Generic[T]):
         Raises:
             AssertionError: If the column is not found.
         """
-        for column in self.columns:
-            if column.name == column_name:
-                return column
-        assert False, f"Column '{column_name}' not found in table '{self.name}'."
+        try:
+            return self.columns(column_name)
+        except ValueError:
+            assert False, f"Column '{column_name}' not found in table '{self.name}'."
 
     def get_foreign_key_column(self, table: SqlTable) -> SqlColumn | None:
         """Get the foreign key column that references the specified table.
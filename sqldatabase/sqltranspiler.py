@@ -30,9 +30,24 @@ class SqlTranspiler:
     Attributes:
         output_dialect (ESqlDialect): The target SQL dialect for transpilation.
         _cache (dict[tuple[str, str | None], sqlglot.Expression]): Cache for parsed SQL expressions.
+        _transpiled_sql_cache (dict[tuple[str, str | None, str, bool], str]): Cache for transpiled
+            SQL templates, keyed by the query with normalized parameter names.
     """
 
     _cache: dict[tuple[str, str | None], sqlglot.Expression] = {}
+    _transpiled_sql_cache: dict[tuple[str, str | None, str, bool], str] = {}
+    _TRANSPILED_SQL_CACHE_SIZE = 500
+    _NAMED_PARAMETER_PATTERN = re.compile(
+        r"('(?:''|[^'])*'|\"(?:[^\"]|\"\")*\")"  # string literals, kept as they are
+        r"|(?<![:\w])([:@$])([a-zA-Z_][a-zA-Z0-9_]*)"
+    )
+    _TEMPLATE_PARAMETER_PREFIX = "parameter__"
+    _STRING_LITERAL_PATTERN = re.compile(
+        r"('(?:''|[^'])*')"  # single-quoted strings
+        r'|("(?:[^"]|"")*")'  # double-quoted strings (optionally used for identifiers or strings)
+    )
+    _FIND_NAMED_PARAMETERS_PATTERN = re.compile(r"(?<!:)[:@$][a-zA-Z_][a-zA-Z0-9_]*")
+    _FIND_POSITIONAL_PLACEHOLDERS_PATTERN = re.compile(r"[$@]\d+|\?")
 
     def __init__(self, output_dialect: ESqlDialect) -> None:
         """Initialize a SqlTranspiler instance.
@@ -80,14 +95,140 @@ class SqlTranspiler:
         Returns:
             str: The transpiled SQL query.
         """
-        parsed_sql = self._parse(sql, input_dialect)
-        parsed_sql = self._update_parsed_sql(parsed_sql)
-        transpiled_sql = parsed_sql.sql(
-            dialect=self.output_dialect.value, pretty=pretty
+        template_sql, parameter_names = self._normalize_named_parameters(sql)
+        transpiled_sql = self._transpile_template(template_sql, input_dialect, pretty)
+        return self._restore_named_parameters(transpiled_sql, parameter_names)
+
+    def transpile_normalized(
+        self,
+        sql: str,
+        parameters: dict[str, Any] | Sequence | None = None,
+        input_dialect: ESqlDialect | None = None,
+        pretty: bool = False,
+    ) -> tuple[str, dict[str, Any] | Sequence]:
+        """Transpile a SQL query and its parameters with named parameters renamed by position.
+
+        Queries of the same shape then have identical SQL, so the driver can reuse
+        the statement it prepared for them. Dialects which bind parameters by
+        position are transpiled as by transpile.
+
+        Args:
+            sql (str): The SQL query to transpile.
+            parameters (dict[str, Any] | Sequence | None, optional): Parameters for the query. Defaults to None.
+            input_dialect (ESqlDialect | None, optional): The source SQL dialect. Defaults to None.
+            pretty (bool, optional): Whether to format the SQL query. Defaults to False.
+
+        Returns:
+            tuple[str, dict[str, Any] | Sequence]: The transpiled SQL query and its parameters.
+
+        Raises:
+            ValueError: If the query references a named parameter missing from parameters.
+        """
+        if self.output_dialect != ESqlDialect.SQLITE or not isinstance(
+            parameters, dict
+        ):
+            return self.transpile(sql, parameters, input_dialect, pretty)
+        template_sql, parameter_names = self._normalize_named_parameters(sql)
+        transpiled_sql = self._transpile_template(template_sql, input_dialect, pretty)
+        try:
+            parameters = {
+                f"{self._TEMPLATE_PARAMETER_PREFIX}{index}": parameters[name]
+                for index, name in enumerate(parameter_names)
+            }
+        except KeyError as error:
+            raise ValueError(
+                f"No value was given for the parameter :{error.args[0]}."
+            ) from None
+        return transpiled_sql, parameters
+
+    def _transpile_template(
+        self,
+        template_sql: str,
+        input_dialect: ESqlDialect | None,
+        pretty: bool,
+    ) -> str:
+        """Transpile a SQL query with normalized parameter names, reusing earlier results.
+
+        Args:
+            template_sql (str): The SQL query with normalized parameter names.
+            input_dialect (ESqlDialect | None): The source SQL dialect.
+            pretty (bool): Whether to format the SQL query.
+
+        Returns:
+            str: The transpiled SQL query with normalized parameter names.
+        """
+        cache_key = (
+            template_sql,
+            input_dialect.value if input_dialect is not None else None,
+            self.output_dialect.value,
+            pretty,
         )
-        transpiled_sql = self._update_transpiled_sql(transpiled_sql)
+        transpiled_sql = self._transpiled_sql_cache.get(cache_key)
+        if transpiled_sql is None:
+            parsed_sql = self._parse(template_sql, input_dialect)
+            parsed_sql = self._update_parsed_sql(parsed_sql)
+            transpiled_sql = parsed_sql.sql(
+                dialect=self.output_dialect.value, pretty=pretty
+            )
+            transpiled_sql = self._update_transpiled_sql(transpiled_sql)
+            cache = self._transpiled_sql_cache
+            if len(cache) >= self._TRANSPILED_SQL_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[cache_key] = transpiled_sql
         return transpiled_sql
 
+    def _normalize_named_parameters(self, sql: str) -> tuple[str, list[str]]:
+        """Replace named parameters in a SQL query with names based on their order.
+
+        Generated parameter names differ between queries of the same shape, so
+        normalizing them lets such queries share one transpiled template.
+
+        Args:
+            sql (str): The SQL query.
+
+        Returns:
+            tuple[str, list[str]]: The normalized SQL query and the original parameter names
+                in order of their normalized names.
+        """
+        parameter_names: list[str] = []
+        indexes: dict[str, int] = {}
+
+        def normalize(match: re.Match) -> str:
+            if match.group(1) is not None:
+                return match.group(1)
+            prefix, name = match.group(2, 3)
+            index = indexes.get(name)
+            if index is None:
+                index = indexes[name] = len(parameter_names)
+                parameter_names.append(name)
+            return f"{prefix}{self._TEMPLATE_PARAMETER_PREFIX}{index}"
+
+        return self._NAMED_PARAMETER_PATTERN.sub(normalize, sql), parameter_names
+
+    def _restore_named_parameters(self, sql: str, parameter_names: list[str]) -> str:
+        """Restore the original parameter names in a transpiled SQL template.
+
+        Args:
+            sql (str): The transpiled SQL template.
+            parameter_names (list[str]): The original parameter names.
+
+        Returns:
+            str: The transpiled SQL query with the original parameter names.
+        """
+        if not parameter_names or self._TEMPLATE_PARAMETER_PREFIX not in sql:
+            return sql
+        prefix_length = len(self._TEMPLATE_PARAMETER_PREFIX)
+
+        def restore(match: re.Match) -> str:
+            name = match.group(3)
+            if match.group(1) is not None or not name.startswith(
+                self._TEMPLATE_PARAMETER_PREFIX
+            ):
+                return match.group(0)
+            return f"{match.group(2)}{parameter_names[int(name[prefix_length:])]}"
+
+        return self._NAMED_PARAMETER_PATTERN.sub(restore, sql)
+
     def transpile_parameters(
         self,
         sql: str,
@@ -146,8 +287,8 @@ class SqlTranspiler:
         self._cache[cache_key] = parsed_sql
         return parsed_sql
 
-    @staticmethod
-    def _remove_string_literals(sql: str) -> str:
+    @classmethod
+    def _remove_string_literals(cls, sql: str) -> str:
         """Remove string literals from a SQL query.
 
         Args:
@@ -156,11 +297,9 @@ class SqlTranspiler:
         Returns:
             str: The SQL query with string literals removed.
         """
-        pattern = re.compile(
-            r"('(?:''|[^'])*')"  # single-quoted strings
-            r'|("(?:[^"]|"")*")'  # double-quoted strings (optionally used for identifiers or strings)
-        )
-        return pattern.sub("", sql)
+        if "'" not in sql and '"' not in sql:
+            return sql
+        return cls._STRING_LITERAL_PATTERN.sub("", sql)
 
     def _find_named_parameters(self, sql: str) -> list[str]:
         """Find named parameters in a SQL query.
@@ -172,7 +311,7 @@ class SqlTranspiler:
             list[str]: A list of named parameters.
         """
         preprocessed_sql = self._remove_string_literals(sql)
-        return re.findall(r"(?<!:)[:@$][a-zA-Z_][a-zA-Z0-9_]*", preprocessed_sql)
+        return self._FIND_NAMED_PARAMETERS_PATTERN.findall(preprocessed_sql)
 
     def _find_positional_placeholders(self, sql: str) -> list[str]:
         """Find positional placeholders in a SQL query.
@@ -184,7 +323,7 @@ class SqlTranspiler:
             list[str]: A list of positional placeholders.
         """
         preprocessed_sql = self._remove_string_literals(sql)
-        return re.findall(r"[$@]\d+|\?", preprocessed_sql)
+        return self._FIND_POSITIONAL_PLACEHOLDERS_PATTERN.findall(preprocessed_sql)
 
     def _find_named_parameters_and_positional_placeholders(self, sql: str) -> list[str]:
         """Find both named parameters and positional placeholders in a SQL query.
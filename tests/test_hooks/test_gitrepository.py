@@ -0,0 +1,78 @@
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "hooks" / "shared"))
+
+from gitrepository import GitRepository
+
+
+@unittest.skipIf(shutil.which("git") is None, "git is not installed")
+class GitRepositoryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self._temp_dir.name)
+        self._git("init", "-q")
+        self._git("config", "user.email", "test@example.com")
+        self._git("config", "user.name", "test")
+        (self.path / "renamed.txt").write_text("renamed\n" * 20)
+        (self.path / "reverted.txt").write_text("original\n")
+        self._git("add", ".")
+        self._git("commit", "-q", "-m", "initial")
+        self._git("mv", "renamed.txt", "renamed_new.txt")
+        (self.path / "reverted.txt").write_text("staged\n")
+        self._git("add", "reverted.txt")
+        (self.path / "reverted.txt").write_text("original\n")
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def _git(self, *args: str) -> list[str]:
+        process = subprocess.run(
+            ["git", *args], cwd=self.path, capture_output=True, text=True, check=True
+        )
+        return sorted(process.stdout.split())
+
+    @staticmethod
+    def _names(files: list[Path]) -> list[str]:
+        return sorted(file.name for file in files)
+
+    def test_staged_files(self) -> None:
+        repository = GitRepository(self.path)
+        self.assertEqual(
+            self._names(repository.get_staged_files()),
+            self._git("diff", "--cached", "--name-only"),
+        )
+        self.assertEqual(
+            self._names(repository.get_staged_files()),
+            ["renamed_new.txt", "reverted.txt"],
+        )
+        self.assertTrue(repository.has_staged_changes())
+
+    def test_changed_files(self) -> None:
+        repository = GitRepository(self.path)
+        self.assertEqual(
+            self._names(repository.get_changed_files()),
+            self._git("diff", "HEAD", "--name-only"),
+        )
+        self.assertEqual(
+            self._names(repository.get_changed_files()), ["renamed_new.txt"]
+        )
+
+    def test_cached_results_end_with_block(self) -> None:
+        repository = GitRepository(self.path)
+        with repository.cached():
+            changed_files = repository.get_changed_files()
+            (self.path / "reverted.txt").write_text("changed outside\n")
+            self.assertEqual(repository.get_changed_files(), changed_files)
+        self.assertEqual(
+            self._names(repository.get_changed_files()),
+            ["renamed_new.txt", "reverted.txt"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
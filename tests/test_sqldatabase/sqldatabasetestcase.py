@@ -415,6 +415,31 @@ class SqlDatabaseTestCase(BaseTestCase):
         )[0][user_progress_table.columns.CORRECT]
         self.assertEqual(correct_answers_count, new_correct_answers_count)
 
+    def _test_transaction_rollback(self) -> None:
+        user_progress_table = self.database.tables.USER_PROGRESS
+        user_progresses_count = user_progress_table.record_count()
+
+        with self.assertRaises(ValueError):
+            with self.database.transaction():
+                user_progress_table.delete_records(
+                    user_progress_table.columns.USER_ID.filters.IS_GREATER_THAN(0)
+                )
+                self.assertEqual(user_progress_table.record_count(), 0)
+                raise ValueError("Rollback expected.")
+        self.assertEqual(user_progress_table.record_count(), user_progresses_count)
+
+        with self.database.transaction():
+            with self.assertRaises(ValueError):
+                with self.database.transaction():
+                    user_progress_table.delete_records(
+                        user_progress_table.columns.USER_ID.filters.IS_GREATER_THAN(0)
+                    )
+                    raise ValueError("Rollback to savepoint expected.")
+            self.assertEqual(
+                user_progress_table.record_count(), user_progresses_count
+            )
+        self.assertEqual(user_progress_table.record_count(), user_progresses_count)
+
     def _test_delete_user_and_user_progress(self) -> None:
         user_id = 2
         users_table = self.database.tables.USERS
@@ -4,12 +4,17 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parents[2]))
 
+from sqldatabase import SqliteDatabase, SqlTables
 from tests.test_sqldatabase.dictionarydatabase import (
     DictionarySqliteDatabase,
 )
 from tests.test_sqldatabase.sqldatabasetestcase import SqlDatabaseTestCase
 
 
+class PragmasSqliteDatabase(SqliteDatabase[SqlTables]):
+    tables = SqlTables()
+
+
 class SqliteDatabaseTestCase(SqlDatabaseTestCase):
     @classmethod
     def setUpClass(cls):
@@ -21,6 +26,28 @@ class SqliteDatabaseTestCase(SqlDatabaseTestCase):
     def test_connection(self) -> None:
         pass
 
+    def test_pragmas(self) -> None:
+        self.assertEqual(
+            self.database.execute("PRAGMA journal_mode").fetchall()[0][0], "delete"
+        )
+        self.assertFalse(self.database.autocommit)
+        path = self.get_temp_dir_path() / "test_pragmas.db"
+        database = PragmasSqliteDatabase(path, pragmas=SqliteDatabase.fast_pragmas)
+        self.assertEqual(
+            database.execute("PRAGMA journal_mode").fetchall()[0][0], "wal"
+        )
+        self.assertEqual(database.execute("PRAGMA synchronous").fetchall()[0][0], 1)
+        self.assertFalse(database.autocommit)
+        database.close()
+        for pragmas in (
+            {"journal_mode": "WAL; DROP TABLE words"},
+            {"cache_size": "-65536"},
+            {"foreign_keys": "ON"},
+        ):
+            with self.subTest(pragmas=pragmas):
+                with self.assertRaises(ValueError):
+                    PragmasSqliteDatabase(path, pragmas=pragmas)
+
     def test_foreign_key_column_to_primary_key_column_reference(self) -> None:
         self._test_foreign_key_column_to_primary_key_column_reference()
 
@@ -75,6 +102,9 @@ class SqliteDatabaseTestCase(SqlDatabaseTestCase):
     def test_delete_user_and_user_progress(self) -> None:
         self._test_delete_user_and_user_progress()
 
+    def test_transaction_rollback(self) -> None:
+        self._test_transaction_rollback()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -78,6 +78,9 @@ class SqlServerDatabaseTestCase(SqlDatabaseTestCase):
     def test_delete_user_and_user_progress(self) -> None:
         self._test_delete_user_and_user_progress()
 
+    def test_transaction_rollback(self) -> None:
+        self._test_transaction_rollback()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -158,6 +158,39 @@ class SqlTranspilerTestCase(BaseTestCase):
         parsed_sql = transpiler._parse(sql, input_dialect)
         self.assertIs(parsed_sql, transpiler._cache[(sql, input_dialect.value)])
 
+    def test_transpiled_sql_template_reuse(self) -> None:
+        transpiler = SqlTranspiler(ESqlDialect.SQLITE)
+        sql = "SELECT name FROM users WHERE name = :users_name_{} AND note != ':x'"
+        transpiled_sql = transpiler.transpile_sql(sql.format(0), ESqlDialect.SQLITE)
+        cache_size = len(transpiler._transpiled_sql_cache)
+        self.assertEqual(
+            transpiler.transpile_sql(sql.format(1), ESqlDialect.SQLITE),
+            transpiled_sql.replace(":users_name_0", ":users_name_1"),
+        )
+        self.assertEqual(len(transpiler._transpiled_sql_cache), cache_size)
+
+    def test_transpile_normalized(self) -> None:
+        transpiler = SqlTranspiler(ESqlDialect.SQLITE)
+        sql = "SELECT name FROM users WHERE name = :users_name_{0} OR alias = :users_name_{0}"
+        transpiled_sql, parameters = transpiler.transpile_normalized(
+            sql.format(0), {"users_name_0": "John"}, ESqlDialect.SQLITE
+        )
+        self.assertEqual(
+            transpiler.transpile_normalized(
+                sql.format(1), {"users_name_1": "Jane"}, ESqlDialect.SQLITE
+            ),
+            (transpiled_sql, {"parameter__0": "Jane"}),
+        )
+        self.assertEqual(parameters, {"parameter__0": "John"})
+
+    def test_transpile_normalized_missing_parameter(self) -> None:
+        transpiler = SqlTranspiler(ESqlDialect.SQLITE)
+        sql = "SELECT name FROM users WHERE name = :users_name_0 AND age = :users_age_0"
+        with self.assertRaisesRegex(ValueError, ":users_age_0"):
+            transpiler.transpile_normalized(
+                sql, {"users_name_0": "John"}, ESqlDialect.SQLITE
+            )
+
     def test_sort_parameters(self) -> None:
         sql, parameters = self.test_data[self.test_name]
         transpiler = SqlTranspiler(ESqlDialect.SQLSERVER)